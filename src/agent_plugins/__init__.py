@@ -17,30 +17,42 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
+import stat
+import time
+import hashlib
+import threading
 import shutil
 import subprocess
+import functools
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Set
 
 import typer
-import yaml
-import httpx
-import readchar
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
-from rich.tree import Tree
-from rich.live import Live
+from rich.text import Text
 
 
 # =============================================================================
 # GitHub API Helpers
 # =============================================================================
 
+_GITHUB_PREFIX = "https://github.com/"
+
+
+@functools.lru_cache(maxsize=4)
 def get_github_token(cli_token: Optional[str] = None) -> Optional[str]:
-    """Return GitHub token from CLI arg, GH_TOKEN, or GITHUB_TOKEN env var."""
+    """Return GitHub token from CLI arg, GH_TOKEN, or GITHUB_TOKEN env var.
+    
+    Cached per process; the environment is read once rather than per clone.
+    """
     token = (cli_token or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or "").strip()
     return token if token else None
 
@@ -62,8 +74,8 @@ def get_authenticated_git_url(url: str, token: Optional[str] = None) -> str:
         return url
     
     # Convert https://github.com/user/repo.git to https://TOKEN@github.com/user/repo.git
-    if url.startswith("https://github.com/"):
-        return url.replace("https://github.com/", f"https://{token}@github.com/")
+    if url.startswith(_GITHUB_PREFIX):
+        return f"https://{token}@github.com/{url[len(_GITHUB_PREFIX):]}"
     return url
 
 
@@ -73,6 +85,8 @@ def get_authenticated_git_url(url: str, token: Optional[str] = None) -> str:
 
 def get_key() -> str:
     """Get a single keypress in a cross-platform way using readchar."""
+    import readchar  # Only needed by interactive selection
+    
     try:
         key = readchar.readkey()
         
@@ -117,26 +131,33 @@ def select_agents_interactive(
     selected = set(preselected or [])
     cursor_index = 0
     
+    # Existence doesn't change while the picker is open, so probe each agent
+    # once instead of on every redraw
+    installed_agents = {
+        key: check_agent_installed(key) or agents[key]["home"].exists()
+        for key in option_keys
+    }
+    
+    def format_line(i: int) -> str:
+        """Render one agent row for the current cursor and selections."""
+        key = option_keys[i]
+        agent = agents[key]
+        cursor = "→" if i == cursor_index else " "
+        check = "✓" if key in selected else " "
+        installed = "✓" if installed_agents[key] else " "
+        
+        if i == cursor_index:
+            return f"[bold cyan]{cursor} [{check}] {agent['name']}[/bold cyan] [dim](installed: {installed})[/dim]"
+        return f"[white]{cursor} [{check}] {agent['name']}[/white] [dim](installed: {installed})[/dim]"
+    
+    # Rendered rows; keypresses re-render only the rows they affect
+    lines = [format_line(i) for i in range(len(option_keys))]
+    
     def create_selection_panel():
         """Create the selection panel with current selections."""
-        lines = []
-        for i, key in enumerate(option_keys):
-            agent = agents[key]
-            cursor = "→" if i == cursor_index else " "
-            check = "✓" if key in selected else " "
-            installed = "✓" if check_agent_installed(key) or agent["home"].exists() else " "
-            
-            if i == cursor_index:
-                line = f"[bold cyan]{cursor} [{check}] {agent['name']}[/bold cyan] [dim](installed: {installed})[/dim]"
-            else:
-                line = f"[white]{cursor} [{check}] {agent['name']}[/white] [dim](installed: {installed})[/dim]"
-            lines.append(line)
-        
-        lines.append("")
-        lines.append("[dim]↑/↓: navigate  Space: toggle  A: all  Enter: confirm  Esc: cancel[/dim]")
-        
         return Panel(
-            "\n".join(lines),
+            "\n".join(lines)
+            + "\n\n[dim]↑/↓: navigate  Space: toggle  A: all  Enter: confirm  Esc: cancel[/dim]",
             title=f"[bold cyan]{prompt_text}[/bold cyan]",
             border_style="cyan"
         )
@@ -144,37 +165,44 @@ def select_agents_interactive(
     # Check if we're in an interactive terminal
     if not sys.stdin.isatty():
         # Non-interactive: return preselected or installed agents
-        return list(selected) if selected else [k for k in option_keys if check_agent_installed(k) or agents[k]["home"].exists()]
+        return list(selected) if selected else [k for k in option_keys if installed_agents[k]]
+    
+    from rich.live import Live  # Only the interactive picker needs it
     
     try:
-        with Live(create_selection_panel(), console=console, transient=True, refresh_per_second=10) as live:
+        # No auto-refresh thread: the loop blocks on get_key(), so redraw only on input
+        with Live(create_selection_panel(), console=console, transient=True, auto_refresh=False) as live:
             while True:
                 try:
                     key = get_key()
                     
-                    if key == 'up':
-                        cursor_index = (cursor_index - 1) % len(option_keys)
-                    elif key == 'down':
-                        cursor_index = (cursor_index + 1) % len(option_keys)
+                    if key in ('up', 'down'):
+                        previous = cursor_index
+                        step = -1 if key == 'up' else 1
+                        cursor_index = (cursor_index + step) % len(option_keys)
+                        lines[previous] = format_line(previous)
+                        lines[cursor_index] = format_line(cursor_index)
                     elif key == 'space':
                         current_key = option_keys[cursor_index]
                         if current_key in selected:
                             selected.remove(current_key)
                         else:
                             selected.add(current_key)
+                        lines[cursor_index] = format_line(cursor_index)
                     elif key == 'a':
                         # Toggle all
                         if len(selected) == len(option_keys):
                             selected.clear()
                         else:
                             selected = set(option_keys)
+                        lines[:] = [format_line(i) for i in range(len(option_keys))]
                     elif key == 'enter':
                         break
                     elif key == 'esc':
                         console.print("\n[yellow]Selection cancelled[/yellow]")
                         raise typer.Exit(1)
                     
-                    live.update(create_selection_panel())
+                    live.update(create_selection_panel(), refresh=True)
                     
                 except KeyboardInterrupt:
                     console.print("\n[yellow]Selection cancelled[/yellow]")
@@ -182,7 +210,7 @@ def select_agents_interactive(
     except Exception as e:
         # Fallback for non-TTY environments
         console.print(f"[yellow]Interactive mode unavailable, using defaults[/yellow]")
-        return list(selected) if selected else [k for k in option_keys if check_agent_installed(k) or agents[k]["home"].exists()]
+        return list(selected) if selected else [k for k in option_keys if installed_agents[k]]
     
     return list(selected)
 
@@ -191,11 +219,47 @@ def select_agents_interactive(
 # Constants & Agent Configuration
 # =============================================================================
 
+# Resolved once; every agent path below hangs off it
+_HOME = Path.home()
+
 # Canonical location for agent-plugins (source of truth)
-AGENT_PLUGINS_HOME = Path.home() / ".agent"
+AGENT_PLUGINS_HOME = _HOME / ".agent"
+
+# Canonical component directories under AGENT_PLUGINS_HOME
+MARKETPLACES_DIR = AGENT_PLUGINS_HOME / "plugins" / "marketplaces"
+PLUGIN_CACHE_DIR = AGENT_PLUGINS_HOME / "plugins" / "cache"
+SKILLS_DIR = AGENT_PLUGINS_HOME / "skills"
+AGENTS_DIR = AGENT_PLUGINS_HOME / "agents"
+COMMANDS_DIR = AGENT_PLUGINS_HOME / "commands"
+HOOKS_DIR = AGENT_PLUGINS_HOME / "hooks"
+
+# Claude Code's own marketplace clones (often the primary source)
+CLAUDE_MARKETPLACES_DIR = _HOME / ".claude" / "plugins" / "marketplaces"
+
+# Upper bound on concurrent git processes (clones/pulls are network-bound)
+MAX_GIT_WORKERS = 8
+
+# Upper bound on worker threads for parallel local filesystem work
+MAX_IO_WORKERS = 8
+
+# Evaluated once - checked on every link operation
+_IS_WIN = sys.platform == "win32"
+
+# Optional faster JSON decoder for catalogs and ~/.agent state files (pip install agent-plugins[fast])
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Claude local path after `claude migrate-installer` (removes from PATH, creates alias here)
-CLAUDE_LOCAL_PATH = Path.home() / ".claude" / "local" / "claude"
+CLAUDE_LOCAL_PATH = _HOME / ".claude" / "local" / "claude"
+
+# Built-in commands bundled with the package (resolved once at import)
+try:
+    import importlib.resources
+    _PKG_COMMANDS_DIR = importlib.resources.files("agent_plugins").joinpath("commands")
+except Exception:
+    _PKG_COMMANDS_DIR = None
 
 # Agent-specific configurations
 # Folder structures sourced from: https://github.com/github/spec-kit/blob/main/AGENTS.md
@@ -203,7 +267,7 @@ CLAUDE_LOCAL_PATH = Path.home() / ".claude" / "local" / "claude"
 AGENT_CONFIG = {
     "claude": {
         "name": "Claude Code",
-        "home": Path.home() / ".claude",
+        "home": _HOME / ".claude",
         "project_dir": ".claude",
         "skills_dir": "skills",
         "commands_dir": "commands",          # .claude/commands/
@@ -221,14 +285,14 @@ AGENT_CONFIG = {
     },
     "opencode": {
         "name": "OpenCode",
-        "home": Path.home() / ".opencode",
+        "home": _HOME / ".opencode",
         "project_dir": ".opencode",
         "skills_dir": "skills",
         "commands_dir": "command",           # .opencode/command/ (singular!)
-        "commands_alt_dir": Path.home() / ".config" / "opencode" / "command",
+        "commands_alt_dir": _HOME / ".config" / "opencode" / "command",
         "agents_dir": "agent",               # .opencode/agent/ (singular!)
-        "agents_alt_dir": Path.home() / ".config" / "opencode" / "agent",
-        "skills_alt_dir": Path.home() / ".config" / "opencode" / "skills",
+        "agents_alt_dir": _HOME / ".config" / "opencode" / "agent",
+        "skills_alt_dir": _HOME / ".config" / "opencode" / "skills",
         "hooks_dir": None,
         "plugins_dir": None,
         "command_format": "markdown",
@@ -242,7 +306,7 @@ AGENT_CONFIG = {
     },
     "codex": {
         "name": "Codex CLI",
-        "home": Path.home() / ".codex",
+        "home": _HOME / ".codex",
         "project_dir": ".codex",
         "skills_dir": "skills",
         "commands_dir": "commands",          # .codex/commands/
@@ -260,7 +324,7 @@ AGENT_CONFIG = {
     },
     "gemini": {
         "name": "Gemini CLI",
-        "home": Path.home() / ".gemini",
+        "home": _HOME / ".gemini",
         "project_dir": ".gemini",
         "skills_dir": "skills",
         "commands_dir": "commands",          # .gemini/commands/
@@ -278,7 +342,7 @@ AGENT_CONFIG = {
     },
     "cursor-agent": {
         "name": "Cursor",
-        "home": Path.home() / ".cursor",
+        "home": _HOME / ".cursor",
         "project_dir": ".cursor",
         "skills_dir": "skills",
         "commands_dir": "commands",          # .cursor/commands/
@@ -296,7 +360,7 @@ AGENT_CONFIG = {
     },
     "windsurf": {
         "name": "Windsurf",
-        "home": Path.home() / ".windsurf",
+        "home": _HOME / ".windsurf",
         "project_dir": ".windsurf",
         "skills_dir": "skills",
         "commands_dir": "workflows",         # .windsurf/workflows/
@@ -314,7 +378,7 @@ AGENT_CONFIG = {
     },
     "copilot": {
         "name": "GitHub Copilot",
-        "home": Path.home() / ".github",
+        "home": _HOME / ".github",
         "project_dir": ".github",
         "skills_dir": None,
         "commands_dir": "agents",            # .github/agents/
@@ -332,7 +396,7 @@ AGENT_CONFIG = {
     },
     "qwen": {
         "name": "Qwen Code",
-        "home": Path.home() / ".qwen",
+        "home": _HOME / ".qwen",
         "project_dir": ".qwen",
         "skills_dir": "skills",
         "commands_dir": "commands",          # .qwen/commands/
@@ -350,7 +414,7 @@ AGENT_CONFIG = {
     },
     "kilocode": {
         "name": "Kilo Code",
-        "home": Path.home() / ".kilocode",
+        "home": _HOME / ".kilocode",
         "project_dir": ".kilocode",
         "skills_dir": "skills",
         "commands_dir": "rules",             # .kilocode/rules/
@@ -368,7 +432,7 @@ AGENT_CONFIG = {
     },
     "auggie": {
         "name": "Auggie CLI",
-        "home": Path.home() / ".augment",
+        "home": _HOME / ".augment",
         "project_dir": ".augment",
         "skills_dir": "skills",
         "commands_dir": "rules",             # .augment/rules/
@@ -386,7 +450,7 @@ AGENT_CONFIG = {
     },
     "codebuddy": {
         "name": "CodeBuddy",
-        "home": Path.home() / ".codebuddy",
+        "home": _HOME / ".codebuddy",
         "project_dir": ".codebuddy",
         "skills_dir": "skills",
         "commands_dir": "commands",          # .codebuddy/commands/
@@ -404,7 +468,7 @@ AGENT_CONFIG = {
     },
     "roo": {
         "name": "Roo Code",
-        "home": Path.home() / ".roo",
+        "home": _HOME / ".roo",
         "project_dir": ".roo",
         "skills_dir": "skills",
         "commands_dir": "rules",             # .roo/rules/
@@ -422,7 +486,7 @@ AGENT_CONFIG = {
     },
     "q": {
         "name": "Amazon Q Developer CLI",
-        "home": Path.home() / ".amazonq",
+        "home": _HOME / ".amazonq",
         "project_dir": ".amazonq",
         "skills_dir": "skills",
         "commands_dir": "prompts",           # .amazonq/prompts/
@@ -440,7 +504,7 @@ AGENT_CONFIG = {
     },
     "amp": {
         "name": "Amp",
-        "home": Path.home() / ".agents",
+        "home": _HOME / ".agents",
         "project_dir": ".agents",
         "skills_dir": "skills",
         "commands_dir": "commands",          # .agents/commands/
@@ -458,7 +522,7 @@ AGENT_CONFIG = {
     },
     "shai": {
         "name": "SHAI",
-        "home": Path.home() / ".shai",
+        "home": _HOME / ".shai",
         "project_dir": ".shai",
         "skills_dir": "skills",
         "commands_dir": "commands",          # .shai/commands/
@@ -476,6 +540,32 @@ AGENT_CONFIG = {
     },
 }
 
+# Links `init` creates for each agent, in order:
+# (label, source, supports flag or None, dir key, alt dir key or None,
+#  show target in message, warn when target exists)
+AGENT_LINK_SPECS = (
+    ("Skills", SKILLS_DIR, "supports_skills", "skills_dir", None, True, True),
+    ("Marketplaces", MARKETPLACES_DIR, "supports_plugins", "plugins_dir", None, False, False),
+    ("Agents", AGENTS_DIR, "supports_agents", "agents_dir", None, False, False),
+    ("Commands", COMMANDS_DIR, "supports_commands", "commands_dir", "commands_alt_dir", True, False),
+    ("Hooks", HOOKS_DIR, "supports_hooks", "hooks_dir", None, False, False),
+)
+
+# OpenCode links the merged user + marketplace structure from ~/.agent/opencode/
+OPENCODE_LINK_SPECS = (
+    ("Commands", AGENT_PLUGINS_HOME / "opencode" / "command", None, "commands_dir", "commands_alt_dir", True, False),
+    ("Agents", AGENT_PLUGINS_HOME / "opencode" / "agent", None, "agents_dir", "agents_alt_dir", True, False),
+    ("Skills", AGENT_PLUGINS_HOME / "opencode" / "skills", None, "skills_dir", "skills_alt_dir", True, False),
+    ("Hooks", HOOKS_DIR, "supports_hooks", "hooks_dir", None, False, False),
+)
+
+# Links `sync` (re)creates for each agent: (label, source, supports flag, dir key, alt dir key or None)
+SYNC_LINK_SPECS = (
+    ("Skills", SKILLS_DIR, "supports_skills", "skills_dir", None),
+    ("Marketplaces", MARKETPLACES_DIR, "supports_plugins", "plugins_dir", None),
+    ("Commands", COMMANDS_DIR, "supports_commands", "commands_dir", "commands_alt_dir"),
+)
+
 BANNER = """
  █████╗  ██████╗ ███████╗███╗   ██╗████████╗
 ██╔══██╗██╔════╝ ██╔════╝████╗  ██║╚══██╔══╝
@@ -491,6 +581,22 @@ BANNER = """
 ╚═╝     ╚══════╝ ╚═════╝  ╚═════╝ ╚═╝╚═╝  ╚═══╝╚══════╝
 """
 
+# Manual upgrade instructions, printed as one block
+UPGRADE_COMMANDS_HINT = (
+    "  [cyan]uv tool upgrade agent-plugins[/cyan]\n"
+    "  [dim]or[/dim]\n"
+    "  [cyan]pip install --upgrade agent-plugins[/cyan]"
+)
+GIT_REINSTALL_COMMANDS_HINT = (
+    "  [cyan]uv tool install agent-plugins --force --from git+https://github.com/jms830/agent-plugins.git[/cyan]\n"
+    "  [dim]or[/dim]\n"
+    "  [cyan]pip install --force-reinstall git+https://github.com/jms830/agent-plugins.git[/cyan]"
+)
+
+# Prebuilt so show_banner() skips markup parsing and highlighting on every call
+BANNER_TEXT = Text(BANNER, style="cyan")
+TAGLINE_TEXT = Text("Universal plugin manager for AI coding agents\n", style="dim")
+
 console = Console()
 app = typer.Typer(
     name="agent-plugins",
@@ -531,8 +637,8 @@ app.add_typer(marketplace_app, name="marketplace", hidden=True)
 
 def show_banner():
     """Display the ASCII art banner."""
-    console.print(f"[cyan]{BANNER}[/cyan]")
-    console.print("[dim]Universal plugin manager for AI coding agents[/dim]\n")
+    console.print(BANNER_TEXT)
+    console.print(TAGLINE_TEXT)
 
 
 def get_config_path() -> Path:
@@ -543,9 +649,11 @@ def get_config_path() -> Path:
 def load_config() -> Dict[str, Any]:
     """Load the agent-plugins configuration."""
     config_path = get_config_path()
-    if config_path.exists():
-        with open(config_path, "r") as f:
-            return json.load(f)
+    try:
+        # Single bytes read; the decoder handles UTF-8 itself, no text wrapper needed
+        return json_loads(config_path.read_bytes())
+    except FileNotFoundError:
+        pass
     return {
         "enabled_agents": ["claude", "opencode", "codex", "gemini"],
         "marketplaces": [],
@@ -561,18 +669,32 @@ def save_config(config: Dict[str, Any]):
         json.dump(config, f, indent=2)
 
 
+# Per-process cache of agent CLI detection results (hits and misses)
+_agent_install_cache: Dict[str, bool] = {}
+
+
 def check_agent_installed(agent_key: str) -> bool:
     """Check if an agent CLI is installed.
     
     Special handling for Claude after `claude migrate-installer` which
     removes the original executable from PATH and creates an alias at
     ~/.claude/local/claude instead.
+    
+    Results are cached for the lifetime of the process, so repeated
+    lookups (e.g. redrawing the interactive selector) don't re-scan PATH.
     """
+    cached = _agent_install_cache.get(agent_key)
+    if cached is not None:
+        return cached
+    
     # Special case: Claude migrated installer
-    if agent_key == "claude":
-        if CLAUDE_LOCAL_PATH.exists() and CLAUDE_LOCAL_PATH.is_file():
-            return True
-    return shutil.which(agent_key) is not None
+    if agent_key == "claude" and CLAUDE_LOCAL_PATH.is_file():
+        installed = True
+    else:
+        installed = shutil.which(agent_key) is not None
+    
+    _agent_install_cache[agent_key] = installed
+    return installed
 
 
 def get_installed_agents() -> List[str]:
@@ -606,12 +728,12 @@ def ensure_directory_structure():
     """
     dirs = [
         AGENT_PLUGINS_HOME,
-        AGENT_PLUGINS_HOME / "plugins" / "marketplaces",
-        AGENT_PLUGINS_HOME / "plugins" / "cache",
-        AGENT_PLUGINS_HOME / "skills",
-        AGENT_PLUGINS_HOME / "agents",
-        AGENT_PLUGINS_HOME / "commands",
-        AGENT_PLUGINS_HOME / "hooks",
+        MARKETPLACES_DIR,
+        PLUGIN_CACHE_DIR,
+        SKILLS_DIR,
+        AGENTS_DIR,
+        COMMANDS_DIR,
+        HOOKS_DIR,
         AGENT_PLUGINS_HOME / "opencode" / "command",
         AGENT_PLUGINS_HOME / "opencode" / "agent",
         AGENT_PLUGINS_HOME / "opencode" / "skills",
@@ -628,42 +750,29 @@ def install_builtin_commands():
     
     Returns count of commands installed.
     """
-    import importlib.resources
-    
-    commands_dir = AGENT_PLUGINS_HOME / "commands"
+    commands_dir = COMMANDS_DIR
     commands_dir.mkdir(parents=True, exist_ok=True)
     
     count = 0
     
     # Try to find bundled commands in the package
     try:
-        # Python 3.9+ approach
-        if hasattr(importlib.resources, 'files'):
-            package_commands = importlib.resources.files('agent_plugins').joinpath('commands')
-            if package_commands.is_dir():
-                for item in package_commands.iterdir():
-                    if item.name.endswith('.md'):
-                        dest = commands_dir / item.name
-                        # Always overwrite built-in commands to ensure latest version
-                        dest.write_text(item.read_text())
-                        count += 1
-        else:
-            # Fallback for older Python
-            import pkg_resources
-            package_dir = Path(pkg_resources.resource_filename('agent_plugins', 'commands'))
-            if package_dir.exists():
-                for cmd_file in package_dir.glob('*.md'):
-                    dest = commands_dir / cmd_file.name
-                    shutil.copy2(cmd_file, dest)
+        if _PKG_COMMANDS_DIR is not None and _PKG_COMMANDS_DIR.is_dir():
+            for item in _PKG_COMMANDS_DIR.iterdir():
+                if item.name.endswith('.md'):
+                    dest = commands_dir / item.name
+                    # Always overwrite built-in commands to ensure latest version
+                    dest.write_bytes(item.read_bytes())
                     count += 1
+            return count
     except Exception:
-        # If package resources fail, try relative path (development mode)
-        dev_commands = Path(__file__).parent / "commands"
-        if dev_commands.exists():
-            for cmd_file in dev_commands.glob('*.md'):
-                dest = commands_dir / cmd_file.name
-                shutil.copy2(cmd_file, dest)
-                count += 1
+        pass
+    
+    # If package resources fail, try relative path (development mode)
+    for cmd_file in list_md_files(Path(__file__).parent / "commands"):
+        dest = commands_dir / cmd_file.name
+        dest.write_bytes(cmd_file.read_bytes())
+        count += 1
     
     return count
 
@@ -681,8 +790,7 @@ def load_known_marketplaces() -> Dict[str, Any]:
     mp_path = get_known_marketplaces_path()
     if mp_path.exists():
         try:
-            with open(mp_path, "r") as f:
-                return json.load(f)
+            return json_loads(mp_path.read_bytes())
         except (json.JSONDecodeError, IOError):
             return {}
     return {}
@@ -707,15 +815,21 @@ def get_installed_plugins_paths() -> List[Path]:
 def backup_file_with_date(file_path: Path) -> Optional[Path]:
     """Create a backup of a file with date suffix.
     
+    The backup is a hard link when possible (no data copied - callers
+    replace the original right afterwards), falling back to a full copy
+    across devices or on filesystems without hard links.
+    
     Returns the backup path if created, None otherwise.
     """
     if not file_path.exists() or file_path.is_symlink():
         return None
     
-    from datetime import datetime
-    date_suffix = datetime.now().strftime("%Y%m%d_%H%M%S")
+    date_suffix = time.strftime("%Y%m%d_%H%M%S")
     backup_path = file_path.with_suffix(f".json.bak.{date_suffix}")
-    shutil.copy2(file_path, backup_path)
+    try:
+        os.link(file_path, backup_path)
+    except OSError:
+        shutil.copy2(file_path, backup_path)
     return backup_path
 
 
@@ -758,7 +872,7 @@ def setup_marketplace_metadata_symlinks(force: bool = False) -> Dict[str, str]:
         
         # If Claude file is already a symlink pointing to our file, skip
         if claude_file.is_symlink():
-            if claude_file.resolve() == agent_file.resolve():
+            if symlink_points_to(claude_file, agent_file):
                 results[filename] = "already_linked"
                 continue
             elif force:
@@ -800,7 +914,7 @@ def setup_marketplace_metadata_symlinks(force: bool = False) -> Dict[str, str]:
         
         claude_plugins_dir.mkdir(parents=True, exist_ok=True)
         try:
-            claude_file.symlink_to(agent_file)
+            os.symlink(agent_file, claude_file)
             if "copied" not in results.get(filename, "") and "merged" not in results.get(filename, ""):
                 results[filename] = "symlinked"
             else:
@@ -824,14 +938,14 @@ def setup_plugin_cache_symlink(force: bool = False) -> Dict[str, str]:
     results = {}
     
     claude_cache = AGENT_CONFIG["claude"]["home"] / "plugins" / "cache"
-    agent_cache = AGENT_PLUGINS_HOME / "plugins" / "cache"
+    agent_cache = PLUGIN_CACHE_DIR
     
     # Ensure our cache dir exists
     agent_cache.mkdir(parents=True, exist_ok=True)
     
     # If Claude cache is already a symlink to our location, done
     if claude_cache.is_symlink():
-        if claude_cache.resolve() == agent_cache.resolve():
+        if symlink_points_to(claude_cache, agent_cache):
             results["cache"] = "already_linked"
             return results
         elif force:
@@ -895,7 +1009,7 @@ def build_opencode_structure() -> Dict[str, Any]:
     }
     
     opencode_dir = AGENT_PLUGINS_HOME / "opencode"
-    cache_dir = AGENT_PLUGINS_HOME / "plugins" / "cache"
+    cache_dir = PLUGIN_CACHE_DIR
     
     # Component types and their source/target directories
     components = [
@@ -904,6 +1018,17 @@ def build_opencode_structure() -> Dict[str, Any]:
         ("skills", "skills", "skills", "skills"),
     ]
     
+    # Walk cache/<marketplace>/<plugin>/<version>/ once for all three component types
+    # (list_subdirs takes entry types from scandir, so no stat per entry)
+    cache_versions = []
+    for marketplace in list_subdirs(cache_dir):
+        if marketplace.name.startswith("."):
+            continue
+        for plugin in list_subdirs(marketplace):
+            # Find version directory (usually just one)
+            for version in list_subdirs(plugin):
+                cache_versions.append((plugin, version))
+    
     for comp_name, oc_subdir, user_dir, cache_subdir in components:
         oc_path = opencode_dir / oc_subdir
         oc_path.mkdir(parents=True, exist_ok=True)
@@ -954,46 +1079,32 @@ def build_opencode_structure() -> Dict[str, Any]:
             shutil.rmtree(marketplace_dir)
         marketplace_dir.mkdir(parents=True, exist_ok=True)
         
-        if cache_dir.exists():
-            for marketplace in cache_dir.iterdir():
-                if not marketplace.is_dir() or marketplace.name.startswith("."):
-                    continue
+        for plugin, version in cache_versions:
+            source_dir = version / cache_subdir
+            if source_dir.is_dir():
+                # Check if there's actual content
+                if comp_name == "skills":
+                    # Check for SKILL.md in subdirectories
+                    has_content = has_skill_subdir(source_dir)
+                else:
+                    # Check for .md files
+                    has_content = has_md_file(source_dir)
                 
-                for plugin in marketplace.iterdir():
-                    if not plugin.is_dir():
-                        continue
+                if has_content:
+                    # Create symlink: marketplace/<plugin>/ → cache/.../
+                    link_path = marketplace_dir / plugin.name
+                    if link_path.is_symlink():
+                        link_path.unlink()
+                    elif link_path.exists():
+                        shutil.rmtree(link_path)
                     
-                    # Find version directory (usually just one)
-                    for version in plugin.iterdir():
-                        if not version.is_dir():
-                            continue
-                        
-                        source_dir = version / cache_subdir
-                        if source_dir.exists() and source_dir.is_dir():
-                            # Check if there's actual content
-                            has_content = False
-                            if comp_name == "skills":
-                                # Check for SKILL.md in subdirectories
-                                has_content = any(source_dir.glob("*/SKILL.md"))
-                            else:
-                                # Check for .md files
-                                has_content = any(source_dir.glob("*.md"))
-                            
-                            if has_content:
-                                # Create symlink: marketplace/<plugin>/ → cache/.../
-                                link_path = marketplace_dir / plugin.name
-                                if link_path.is_symlink():
-                                    link_path.unlink()
-                                elif link_path.exists():
-                                    shutil.rmtree(link_path)
-                                
-                                try:
-                                    link_path.symlink_to(source_dir)
-                                    results[comp_name]["marketplace"] += 1
-                                    if plugin.name not in results[comp_name]["plugins"]:
-                                        results[comp_name]["plugins"].append(plugin.name)
-                                except OSError:
-                                    pass
+                    try:
+                        link_path.symlink_to(source_dir)
+                        results[comp_name]["marketplace"] += 1
+                        if plugin.name not in results[comp_name]["plugins"]:
+                            results[comp_name]["plugins"].append(plugin.name)
+                    except OSError:
+                        pass
     
     # Auto-sanitize the cache to fix common YAML issues
     sanitize_results = sanitize_plugin_cache()
@@ -1016,6 +1127,49 @@ def build_merged_commands_directory() -> Dict[str, Any]:
     }
 
 
+def list_subdirs(directory: Path) -> List[Path]:
+    """List a directory's subdirectories sorted by name (missing dir -> []).
+    
+    Uses the entry types from scandir, so only symlinks need a stat.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            names = sorted(entry.name for entry in entries if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return [directory / name for name in names]
+
+
+def has_md_file(directory: Path) -> bool:
+    """Check whether a directory has any .md entry, stopping at the first one."""
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name.endswith(".md") for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def has_skill_subdir(directory: Path) -> bool:
+    """Check whether any subdirectory holds a SKILL.md, stopping at the first one."""
+    try:
+        with os.scandir(directory) as entries:
+            return any(
+                entry.is_dir() and (directory / entry.name / "SKILL.md").exists()
+                for entry in entries
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def list_dir_names(directory: Path) -> Set[str]:
+    """Get the names of a directory's entries with one scandir (missing dir -> empty)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 def import_marketplaces(source: Optional[str] = None) -> Dict[str, Any]:
     """Import and clone missing marketplaces from metadata.
     
@@ -1039,7 +1193,7 @@ def import_marketplaces(source: Optional[str] = None) -> Dict[str, Any]:
         "failed": [],
     }
     
-    marketplaces_dir = AGENT_PLUGINS_HOME / "plugins" / "marketplaces"
+    marketplaces_dir = MARKETPLACES_DIR
     marketplaces_dir.mkdir(parents=True, exist_ok=True)
     
     # Load known marketplaces
@@ -1048,11 +1202,14 @@ def import_marketplaces(source: Optional[str] = None) -> Dict[str, Any]:
     if not known:
         return results
     
+    # Collect clone jobs first so they can run concurrently
+    present = list_dir_names(marketplaces_dir)
+    jobs = []
     for mp_name, mp_info in known.items():
         target_dir = marketplaces_dir / mp_name
         
         # Skip if already exists
-        if target_dir.exists():
+        if mp_name in present:
             results["skipped"].append(mp_name)
             continue
         
@@ -1071,25 +1228,46 @@ def import_marketplaces(source: Optional[str] = None) -> Dict[str, Any]:
             results["failed"].append({"name": mp_name, "error": "No git URL found"})
             continue
         
-        # Clone the repository
-        console.print(f"[cyan]Cloning {mp_name}...[/cyan]")
-        try:
-            clone_url = get_authenticated_git_url(git_url)
-            subprocess.run(
-                ["git", "clone", "--depth", "1", clone_url, str(target_dir)],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            results["imported"].append(mp_name)
-            console.print(f"[green]✓[/green] Imported {mp_name}")
-        except subprocess.CalledProcessError as e:
-            results["failed"].append({"name": mp_name, "error": str(e.stderr)[:100]})
-            console.print(f"[red]✗[/red] Failed to import {mp_name}: {e.stderr[:100]}")
+        jobs.append((mp_name, get_authenticated_git_url(git_url), target_dir))
+    
+    if not jobs:
+        return results
     
+    # Clone the repositories in parallel - each clone is network-bound
+    console.print(f"[cyan]Cloning {', '.join(name for name, _, _ in jobs)}...[/cyan]")
+    with ThreadPoolExecutor(max_workers=min(MAX_GIT_WORKERS, len(jobs))) as executor:
+        errors = executor.map(lambda job: clone_marketplace_repo(job[1], job[2]), jobs)
+        for (mp_name, _, _), error in zip(jobs, errors):
+            if error is None:
+                results["imported"].append(mp_name)
+                console.print(f"[green]✓[/green] Imported {mp_name}")
+            else:
+                results["failed"].append({"name": mp_name, "error": error[:100]})
+                console.print(f"[red]✗[/red] Failed to import {mp_name}: {error[:100]}")
+    
+    get_all_marketplace_dirs.cache_clear()
     return results
 
 
+def clone_marketplace_repo(clone_url: str, target_dir: Path) -> Optional[str]:
+    """Shallow-clone a marketplace repository into target_dir.
+    
+    Safe to call from worker threads: nothing is printed here.
+    
+    Returns None on success, or git's error output on failure.
+    """
+    try:
+        subprocess.run(
+            ["git", "clone", "--depth", "1", clone_url, str(target_dir)],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        return None
+    except subprocess.CalledProcessError as e:
+        return str(e.stderr)
+
+
 def add_to_known_marketplaces(
     name: str,
     git_url: str,
@@ -1100,8 +1278,6 @@ def add_to_known_marketplaces(
     
     Uses Claude-compatible format for interoperability.
     """
-    from datetime import datetime
-    
     known = load_known_marketplaces()
     
     # Determine source format
@@ -1115,34 +1291,30 @@ def add_to_known_marketplaces(
     known[name] = {
         "source": source,
         "installLocation": str(install_location),
-        "lastUpdated": datetime.utcnow().isoformat() + "Z",
+        "lastUpdated": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()) + "Z",
     }
     
     save_known_marketplaces(known)
 
 
-def is_junction(path: Path) -> bool:
-    """Check if a path is a Windows junction point."""
-    if sys.platform != "win32":
-        return False
-    try:
-        import ctypes
-        FILE_ATTRIBUTE_REPARSE_POINT = 0x400
-        attrs = ctypes.windll.kernel32.GetFileAttributesW(str(path))
-        return attrs != -1 and (attrs & FILE_ATTRIBUTE_REPARSE_POINT)
-    except Exception:
-        return False
-
-
 def create_junction(source: Path, target: Path) -> bool:
     """Create a Windows junction point (directory symlink that doesn't need admin).
     
     Junction points work without elevation and are transparent to applications.
     They only work for directories on the same volume.
     """
-    if sys.platform != "win32":
+    if not _IS_WIN:
         return False
     
+    # CPython's own helper sets the reparse point in-process, saving a
+    # cmd.exe spawn per link
+    try:
+        import _winapi
+        _winapi.CreateJunction(str(source), str(target))
+        return True
+    except (ImportError, AttributeError, OSError):
+        pass
+    
     try:
         result = subprocess.run(
             ["cmd", "/c", "mklink", "/J", str(target), str(source)],
@@ -1170,35 +1342,41 @@ def create_link(source: Path, target: Path, force: bool = False) -> bool:
     Returns:
         True if link/copy was created, False if skipped
     """
-    # Handle existing target
-    if target.exists() or target.is_symlink() or is_junction(target):
-        if force:
-            if target.is_symlink():
-                target.unlink()
-            elif is_junction(target):
-                # Junctions are removed like directories on Windows
-                target.rmdir()
-            elif target.is_dir():
-                shutil.rmtree(target)
-            else:
-                target.unlink()
-        else:
+    # Handle existing target - a single lstat tells us whether it exists
+    # and what kind of entry it is (symlink, junction, dir or file)
+    try:
+        target_stat = os.lstat(target)
+    except (FileNotFoundError, NotADirectoryError):
+        target_stat = None
+    
+    if target_stat is not None:
+        if not force:
             console.print(f"[yellow]Warning:[/yellow] {target} already exists, skipping")
             return False
+        
+        if stat.S_ISLNK(target_stat.st_mode):
+            target.unlink()
+        elif _IS_WIN and target_stat.st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT:
+            # Junctions are removed like directories on Windows
+            target.rmdir()
+        elif stat.S_ISDIR(target_stat.st_mode):
+            shutil.rmtree(target)
+        else:
+            target.unlink()
     
     target.parent.mkdir(parents=True, exist_ok=True)
     
     # Strategy 1: Try native symlink first
     # Works on: Linux, macOS, Windows with Developer Mode enabled
     try:
-        target.symlink_to(source)
+        os.symlink(source, target)
         return True
     except OSError:
         pass
     
     # Strategy 2: On Windows, try junction point (no admin needed)
     # Junctions are transparent to applications - Claude/Codex/Gemini work perfectly
-    if sys.platform == "win32" and source.is_dir():
+    if _IS_WIN and source.is_dir():
         if create_junction(source, target):
             console.print(f"[dim]  (using junction point)[/dim]")
             return True
@@ -1213,6 +1391,23 @@ def create_link(source: Path, target: Path, force: bool = False) -> bool:
     return True
 
 
+def symlink_points_to(target: Path, source: Path) -> bool:
+    """Check whether target is a symlink that points at source.
+    
+    A single os.readlink() answers the common case (links we created
+    store the absolute source path). Only when the stored value differs -
+    relative links, or a source reached through another symlink - do we
+    fall back to resolving both sides, which lstat's every component.
+    """
+    try:
+        link_value = os.readlink(target)
+    except OSError:
+        return False
+    if Path(link_value) == source:
+        return True
+    return target.resolve() == source.resolve()
+
+
 # Alias for backwards compatibility
 def create_symlink(source: Path, target: Path, force: bool = False) -> bool:
     """Deprecated: Use create_link instead."""
@@ -1225,15 +1420,16 @@ def sync_to_agent(agent_key: str, component: str = "skills"):
     if not agent:
         return False
     
+    # Only skills are synced here - bail out before touching the filesystem
+    if component != "skills" or not agent["supports_skills"]:
+        return False
+    
     source = AGENT_PLUGINS_HOME / component
     if not source.exists():
         return False
     
-    if component == "skills" and agent["supports_skills"]:
-        target = agent["home"] / agent["skills_dir"]
-        return create_symlink(source, target, force=False)
-    
-    return False
+    target = agent["home"] / agent["skills_dir"]
+    return create_link(source, target, force=False)
 
 
 # =============================================================================
@@ -1322,109 +1518,31 @@ def init(
         
         console.print(f"\n  [bold]{agent['name']}[/bold]")
         
-        # OpenCode uses special merged structure from ~/.agent/opencode/
-        if agent_key == "opencode":
-            # Commands: opencode/command/ (has user + marketplace)
-            source = AGENT_PLUGINS_HOME / "opencode" / "command"
-            target = agent.get("commands_alt_dir") or (agent["home"] / agent["commands_dir"] if agent.get("commands_dir") else None)
-            
-            if target:
-                if target.is_symlink() and target.resolve() == source.resolve():
-                    console.print(f"    [dim]Commands: already linked[/dim]")
-                elif create_link(source, target, force=force):
-                    console.print(f"    [green]✓[/green] Commands → {target}")
-            
-            # Agents: opencode/agent/ (has user + marketplace)
-            source = AGENT_PLUGINS_HOME / "opencode" / "agent"
-            target = agent.get("agents_alt_dir") or (agent["home"] / agent["agents_dir"] if agent.get("agents_dir") else None)
-            
-            if target:
-                if target.is_symlink() and target.resolve() == source.resolve():
-                    console.print(f"    [dim]Agents: already linked[/dim]")
-                elif create_link(source, target, force=force):
-                    console.print(f"    [green]✓[/green] Agents → {target}")
-            
-            # Skills: opencode/skills/ (has user + marketplace for opencode-skills plugin)
-            source = AGENT_PLUGINS_HOME / "opencode" / "skills"
-            target = agent.get("skills_alt_dir") or (agent["home"] / agent["skills_dir"] if agent.get("skills_dir") else None)
-            
-            if target:
-                if target.is_symlink() and target.resolve() == source.resolve():
-                    console.print(f"    [dim]Skills: already linked[/dim]")
-                elif create_link(source, target, force=force):
-                    console.print(f"    [green]✓[/green] Skills → {target}")
-            
-            # Hooks (if supported)
-            if agent.get("supports_hooks") and agent.get("hooks_dir"):
-                source = AGENT_PLUGINS_HOME / "hooks"
-                target = agent["home"] / agent["hooks_dir"]
-                if target.is_symlink() and target.resolve() == source.resolve():
-                    console.print(f"    [dim]Hooks: already linked[/dim]")
-                elif create_link(source, target, force=force):
-                    console.print(f"    [green]✓[/green] Hooks linked")
-            
-            continue  # Skip standard agent setup for OpenCode
-        
-        # Standard agent setup (Claude and others)
-        # Skills symlink (user skills only - Claude uses plugin system for marketplace)
-        if agent["supports_skills"]:
-            source = AGENT_PLUGINS_HOME / "skills"
-            target = agent["home"] / agent["skills_dir"]
-            
-            if target.is_symlink() and target.resolve() == source.resolve():
-                console.print(f"    [dim]Skills: already linked[/dim]")
-            elif create_symlink(source, target, force=force):
-                console.print(f"    [green]✓[/green] Skills → {target}")
-            else:
-                console.print(f"    [yellow]⚠[/yellow] Skills: exists (use --force)")
+        # OpenCode uses special merged structure from ~/.agent/opencode/;
+        # Claude only gets user content (it uses its plugin system for marketplace)
+        link_specs = OPENCODE_LINK_SPECS if agent_key == "opencode" else AGENT_LINK_SPECS
         
-        # Sync plugins (if supported)
-        if agent["supports_plugins"] and agent["plugins_dir"]:
-            source = AGENT_PLUGINS_HOME / "plugins" / "marketplaces"
-            target = agent["home"] / agent["plugins_dir"]
-            
-            if target.is_symlink() and target.resolve() == source.resolve():
-                console.print(f"    [dim]Marketplaces: already linked[/dim]")
-            elif create_symlink(source, target, force=force):
-                console.print(f"    [green]✓[/green] Marketplaces linked")
-
-        # Sync agents (user agents only - Claude uses plugin system for marketplace)
-        if agent.get("supports_agents") and agent.get("agents_dir"):
-            source = AGENT_PLUGINS_HOME / "agents"
-            target = agent["home"] / agent["agents_dir"]
-            
-            if target.is_symlink() and target.resolve() == source.resolve():
-                console.print(f"    [dim]Agents: already linked[/dim]")
-            elif create_link(source, target, force=force):
-                console.print(f"    [green]✓[/green] Agents linked")
-
-        # Sync commands (user commands only - Claude uses plugin system for marketplace)
-        if agent.get("supports_commands"):
-            source = AGENT_PLUGINS_HOME / "commands"
+        for label, source, supports_key, dir_key, alt_key, show_target, warn_exists in link_specs:
+            if supports_key and not agent.get(supports_key):
+                continue
             
             # Determine target - some agents use alt location
-            if agent.get("commands_alt_dir"):
-                target = agent["commands_alt_dir"]
-            elif agent.get("commands_dir"):
-                target = agent["home"] / agent["commands_dir"]
+            if alt_key and agent.get(alt_key):
+                target = agent[alt_key]
+            elif agent.get(dir_key):
+                target = agent["home"] / agent[dir_key]
             else:
-                target = None
-            
-            if target:
-                if target.is_symlink() and target.resolve() == source.resolve():
-                    console.print(f"    [dim]Commands: already linked[/dim]")
-                elif create_link(source, target, force=force):
-                    console.print(f"    [green]✓[/green] Commands → {target}")
-
-        # Sync hooks (if supported)
-        if agent.get("supports_hooks") and agent.get("hooks_dir"):
-            source = AGENT_PLUGINS_HOME / "hooks"
-            target = agent["home"] / agent["hooks_dir"]
+                continue
             
-            if target.is_symlink() and target.resolve() == source.resolve():
-                console.print(f"    [dim]Hooks: already linked[/dim]")
+            if symlink_points_to(target, source):
+                console.print(f"    [dim]{label}: already linked[/dim]")
             elif create_link(source, target, force=force):
-                console.print(f"    [green]✓[/green] Hooks linked")
+                if show_target:
+                    console.print(f"    [green]✓[/green] {label} → {target}")
+                else:
+                    console.print(f"    [green]✓[/green] {label} linked")
+            elif warn_exists:
+                console.print(f"    [yellow]⚠[/yellow] {label}: exists (use --force)")
 
     # Set up marketplace metadata symlinks (Claude integration)
     if "claude" in enabled:
@@ -1456,8 +1574,9 @@ def init(
     # Auto-import missing marketplaces
     known = load_known_marketplaces()
     if known:
-        marketplaces_dir = AGENT_PLUGINS_HOME / "plugins" / "marketplaces"
-        missing = [name for name in known.keys() if not (marketplaces_dir / name).exists()]
+        marketplaces_dir = MARKETPLACES_DIR
+        present = list_dir_names(marketplaces_dir)
+        missing = [name for name in known if name not in present]
         
         if missing:
             console.print(f"\n[cyan]Importing {len(missing)} missing marketplace(s)...[/cyan]")
@@ -1474,7 +1593,7 @@ def init(
             # and are accessed via symlinks in the opencode/ structure
             if import_results["imported"]:
                 console.print("\n[cyan]Extracting hooks from imported marketplaces...[/cyan]")
-                hooks = extract_hooks_from_marketplaces()
+                hooks = extract_hooks_from_marketplaces(only=set(import_results["imported"]))
                 console.print(f"[green]✓[/green] Extracted {hooks} hooks")
     
     # Build OpenCode merged structure (commands, agents, skills)
@@ -1655,7 +1774,7 @@ def sync_agent_commands(agent_key: str, force: bool = False) -> bool:
     if not agent or not agent.get("supports_commands"):
         return False
     
-    source = AGENT_PLUGINS_HOME / "commands"
+    source = COMMANDS_DIR
     if not source.exists():
         source.mkdir(parents=True, exist_ok=True)
     
@@ -1671,6 +1790,7 @@ def sync_agent_commands(agent_key: str, force: bool = False) -> bool:
     return create_link(source, target, force=force)
 
 
+@functools.lru_cache(maxsize=1)
 def get_all_marketplace_dirs() -> List[Path]:
     """Get all marketplace directories from all known locations.
     
@@ -1678,28 +1798,95 @@ def get_all_marketplace_dirs() -> List[Path]:
     - ~/.agent/plugins/marketplaces/
     - ~/.claude/plugins/marketplaces/
     - Other agent home dirs with marketplaces
+    
+    The result is cached for the rest of the command; anything that adds
+    or removes a marketplace must call get_all_marketplace_dirs.cache_clear().
     """
     marketplace_dirs = []
+    seen_names = set()
+    seen_ids = set()
     
-    # Check our canonical location
-    agent_mp = AGENT_PLUGINS_HOME / "plugins" / "marketplaces"
-    if agent_mp.exists():
-        for mp_dir in agent_mp.iterdir():
-            if mp_dir.is_dir() and not mp_dir.name.startswith("."):
-                marketplace_dirs.append(mp_dir)
-    
-    # Check Claude's location (often the primary source)
-    claude_mp = Path.home() / ".claude" / "plugins" / "marketplaces"
-    if claude_mp.exists():
-        for mp_dir in claude_mp.iterdir():
-            if mp_dir.is_dir() and not mp_dir.name.startswith("."):
-                # Avoid duplicates by name
-                if not any(existing.name == mp_dir.name for existing in marketplace_dirs):
-                    marketplace_dirs.append(mp_dir)
+    for mp_base in [
+        MARKETPLACES_DIR,          # Our canonical location
+        CLAUDE_MARKETPLACES_DIR,   # Claude's (often the primary source)
+    ]:
+        try:
+            with os.scandir(mp_base) as entries:
+                for entry in entries:
+                    # Avoid duplicates by name (first location wins)
+                    if entry.name.startswith(".") or entry.name in seen_names:
+                        continue
+                    # DirEntry.is_dir() uses the cached d_type - no extra stat
+                    if not entry.is_dir():
+                        continue
+                    # Also avoid duplicates by physical identity, so a
+                    # symlink to a marketplace already listed is skipped
+                    st = entry.stat()
+                    if (st.st_dev, st.st_ino) in seen_ids:
+                        continue
+                    seen_ids.add((st.st_dev, st.st_ino))
+                    seen_names.add(entry.name)
+                    marketplace_dirs.append(Path(entry.path))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
     
     return marketplace_dirs
 
 
+def walk_md_files(root: Path):
+    """Yield (path, rel_path) for every .md file below root.
+    
+    os.scandir-based replacement for root.rglob("*.md") + relative_to():
+    entry types come from the directory listing (no stat per entry) and
+    rel_path is built from the segments already descended. Like rglob,
+    symlinked directories are not followed.
+    """
+    stack = [(root, Path())]
+    while stack:
+        directory, rel_path = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((directory / entry.name, rel_path / entry.name))
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        yield directory / entry.name, rel_path / entry.name
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+
+
+def walk_skill_dirs(root: Path):
+    """Yield skill directories (those containing SKILL.md) under root.
+    
+    Symlinks are followed like `find -L`, with directories visited once
+    by (device, inode). The walk is pruned at each skill directory:
+    nested skills aren't a defined layout, so a skill's own scripts and
+    references are never listed.
+    """
+    seen = set()
+    stack = [os.fspath(root)]
+    while stack:
+        dir_path = stack.pop()
+        try:
+            st = os.stat(dir_path)
+            if (st.st_dev, st.st_ino) in seen:
+                continue
+            seen.add((st.st_dev, st.st_ino))
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        if any(entry.name == "SKILL.md" and entry.is_file() for entry in entries):
+            yield Path(dir_path)
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    stack.append(entry.path)
+            except OSError:
+                pass
+
+
 def extract_agents_from_marketplaces() -> int:
     """DEPRECATED: Agents should stay in cache, not be extracted.
     
@@ -1738,6 +1925,40 @@ def extract_commands_from_marketplaces() -> int:
     return 0
 
 
+def scan_marketplace_hooks(mp_dir: Path) -> List[tuple]:
+    """Find a marketplace's hook source dirs in a single walk.
+    
+    One scandir of the marketplace root and one of plugins/ find every
+    candidate. Candidate dirs aren't checked for hooks.json here.
+    
+    Returns [(source hooks dir, destination name), ...]:
+    the direct hooks folder first, then nested plugin hooks.
+    """
+    found = []
+    
+    try:
+        with os.scandir(mp_dir) as entries:
+            top = {entry.name: entry for entry in entries if entry.is_dir()}
+    except (FileNotFoundError, NotADirectoryError):
+        return found
+    
+    # 1. Direct hooks folder
+    if "hooks" in top:
+        found.append((mp_dir / "hooks", mp_dir.name))
+    
+    # 2. Nested plugin hooks
+    if "plugins" in top:
+        try:
+            with os.scandir(top["plugins"].path) as entries:
+                plugin_names = sorted(entry.name for entry in entries if entry.is_dir())
+        except (FileNotFoundError, NotADirectoryError):
+            plugin_names = []
+        for plugin_name in plugin_names:
+            found.append((mp_dir / "plugins" / plugin_name / "hooks", f"{mp_dir.name}-{plugin_name}"))
+    
+    return found
+
+
 def _extract_commands_from_marketplaces_legacy() -> int:
     """Legacy function to extract commands (kept for reference).
     
@@ -1748,7 +1969,7 @@ def _extract_commands_from_marketplaces_legacy() -> int:
     
     Returns count of commands extracted.
     """
-    commands_dir = AGENT_PLUGINS_HOME / "commands"
+    commands_dir = COMMANDS_DIR
     commands_dir.mkdir(parents=True, exist_ok=True)
     count = 0
     
@@ -1756,71 +1977,164 @@ def _extract_commands_from_marketplaces_legacy() -> int:
         
         # 1. Direct commands folder (preserve relative path)
         for cmd_source in [mp_dir / "commands", mp_dir / ".claude" / "commands"]:
-            if cmd_source.exists():
-                for cmd_file in cmd_source.rglob("*.md"):
-                    rel_path = cmd_file.relative_to(cmd_source)
-                    dest_path = commands_dir / rel_path
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(cmd_file, dest_path)
-                    count += 1
+            for cmd_file, rel_path in walk_md_files(cmd_source):
+                dest_path = commands_dir / rel_path
+                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(cmd_file, dest_path)
+                count += 1
         
         # 2. Nested plugin commands (preserve relative path)
         plugins_dir = mp_dir / "plugins"
         if plugins_dir.exists():
             for plugin_dir in plugins_dir.iterdir():
                 if plugin_dir.is_dir():
-                    cmds_dir = plugin_dir / "commands"
-                    if cmds_dir.exists():
-                        for cmd_file in cmds_dir.rglob("*.md"):
-                            rel_path = cmd_file.relative_to(cmds_dir)
-                            dest_path = commands_dir / rel_path
-                            dest_path.parent.mkdir(parents=True, exist_ok=True)
-                            shutil.copy2(cmd_file, dest_path)
-                            count += 1
+                    for cmd_file, rel_path in walk_md_files(plugin_dir / "commands"):
+                        dest_path = commands_dir / rel_path
+                        dest_path.parent.mkdir(parents=True, exist_ok=True)
+                        shutil.copy2(cmd_file, dest_path)
+                        count += 1
     
     return count
 
 
-def extract_hooks_from_marketplaces() -> int:
+def get_extract_manifest_path() -> Path:
+    """Get the path to the extraction manifest (source fingerprints)."""
+    return AGENT_PLUGINS_HOME / ".extract_cache.json"
+
+
+def load_extract_manifest() -> Dict[str, str]:
+    """Load the extraction manifest: {destination name: source fingerprint}."""
+    try:
+        return json_loads(get_extract_manifest_path().read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_extract_manifest(manifest: Dict[str, str]):
+    """Save the extraction manifest."""
+    manifest_path = get_extract_manifest_path()
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def directory_fingerprint(path: Path) -> str:
+    """Fingerprint a directory tree from its entries' names, sizes and mtimes.
+    
+    Cheap change detection: one scandir per directory and the stat data
+    each DirEntry already carries - file contents are never read.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    stack = [(os.fspath(path), "")]
+    while stack:
+        dir_path, rel = stack.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                st = entry.stat(follow_symlinks=False)
+                rel_name = f"{rel}/{entry.name}"
+                digest.update(f"{rel_name}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_name))
+    return digest.hexdigest()
+
+
+def extract_hooks_from_marketplaces(only: Optional[Set[str]] = None) -> int:
     """Extract hook definitions from marketplaces to ~/.agent/hooks/.
     
     Hooks are defined as hooks.json + scripts in:
     - marketplaces/*/hooks/
     - marketplaces/*/plugins/*/hooks/
     
-    Returns count of hook sets extracted.
+    Destination names can collide across marketplaces (marketplace "a-b"'s
+    hooks/ and marketplace "a"'s plugins/b/hooks/ both map to "a-b"); the
+    last source wins, as with a serial overwrite. Sources are grouped by
+    destination first, so each destination is written by exactly one
+    worker and hook sets are copied in parallel (the work is I/O-bound).
+    Hook sets whose source fingerprint matches the manifest from the last
+    run are left in place instead of being deleted and copied again.
+    
+    If only is given, just the marketplaces with those names are extracted
+    (e.g. the ones init or import just cloned).
+    
+    Returns count of hook sets extracted (including ones already up to date).
     """
-    hooks_dir = AGENT_PLUGINS_HOME / "hooks"
+    hooks_dir = HOOKS_DIR
     hooks_dir.mkdir(parents=True, exist_ok=True)
-    count = 0
     
-    for mp_dir in get_all_marketplace_dirs():
-        
-        # 1. Direct hooks folder
-        mp_hooks = mp_dir / "hooks"
-        if mp_hooks.exists() and (mp_hooks / "hooks.json").exists():
-            dest_dir = hooks_dir / mp_dir.name
-            if dest_dir.exists():
-                shutil.rmtree(dest_dir)
-            shutil.copytree(mp_hooks, dest_dir)
-            count += 1
-        
-        # 2. Nested plugin hooks
-        plugins_dir = mp_dir / "plugins"
-        if plugins_dir.exists():
-            for plugin_dir in plugins_dir.iterdir():
-                if plugin_dir.is_dir():
-                    plugin_hooks = plugin_dir / "hooks"
-                    if plugin_hooks.exists() and (plugin_hooks / "hooks.json").exists():
-                        dest_dir = hooks_dir / f"{mp_dir.name}-{plugin_dir.name}"
-                        if dest_dir.exists():
-                            shutil.rmtree(dest_dir)
-                        shutil.copytree(plugin_hooks, dest_dir)
-                        count += 1
+    mp_dirs = [
+        mp_dir for mp_dir in get_all_marketplace_dirs()
+        if only is None or mp_dir.name in only
+    ]
+    if not mp_dirs:
+        return 0
+    
+    # {destination name: source hooks dir}, later sources replacing earlier ones
+    sources: Dict[str, Path] = {}
+    count = 0
+    for mp_dir in mp_dirs:
+        for hooks_source, dest_name in scan_marketplace_hooks(mp_dir):
+            if (hooks_source / "hooks.json").exists():
+                sources[dest_name] = hooks_source
+                count += 1
+    if not sources:
+        return 0
+    
+    manifest = load_extract_manifest()
+    with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(sources))) as executor:
+        fingerprints = list(executor.map(
+            lambda item: _extract_hook_set(item[1], hooks_dir / item[0], manifest.get(item[0])),
+            sources.items(),
+        ))
+    manifest.update(zip(sources, fingerprints))
+    save_extract_manifest(manifest)
     
     return count
 
 
+def copy_file_fast(src: str, dst: str) -> str:
+    """Copy a file with os.copy_file_range, falling back to shutil.copyfile.
+    
+    copy_file_range lets the kernel share extents (reflink) on CoW
+    filesystems like btrfs/XFS and avoids userspace buffers elsewhere.
+    Some kernel/filesystem combinations return 0 before EOF, so the
+    copied total is checked against the source size and a short copy
+    falls back to shutil.copyfile. Permission bits are kept so hook
+    scripts stay executable; other metadata isn't copied. Usable as a
+    shutil.copytree copy_function.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                copied = 0
+                while True:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+                    if not n:
+                        break
+                    copied += n
+            if copied == size:
+                shutil.copymode(src, dst)
+                return dst
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+    return dst
+
+
+def _extract_hook_set(hooks_source: Path, dest_dir: Path, previous_fingerprint: Optional[str]) -> str:
+    """Copy one hook set to dest_dir unless its source is unchanged.
+    
+    Returns the source fingerprint to record in the manifest.
+    """
+    fingerprint = directory_fingerprint(hooks_source)
+    if previous_fingerprint != fingerprint or not dest_dir.exists():
+        if dest_dir.exists():
+            shutil.rmtree(dest_dir)
+        shutil.copytree(hooks_source, dest_dir, copy_function=copy_file_fast)
+    return fingerprint
+
+
 def extract_skills_from_marketplaces() -> int:
     """DEPRECATED: Skills should stay in cache, not be extracted.
     
@@ -1873,17 +2187,14 @@ def status():
     
     console.print(table)
     
-    # Marketplaces
-    marketplaces_dir = AGENT_PLUGINS_HOME / "plugins" / "marketplaces"
-    if marketplaces_dir.exists():
-        marketplaces = [d.name for d in marketplaces_dir.iterdir() if d.is_dir() and not d.name.startswith(".")]
-        if marketplaces:
-            console.print(f"\n[cyan]Installed Marketplaces:[/cyan] {', '.join(marketplaces)}")
+    # Marketplaces (list_subdirs reads entry types from one scandir)
+    marketplaces = [d.name for d in list_subdirs(MARKETPLACES_DIR) if not d.name.startswith(".")]
+    if marketplaces:
+        console.print(f"\n[cyan]Installed Marketplaces:[/cyan] {', '.join(marketplaces)}")
     
     # Skills count
-    skills_dir = AGENT_PLUGINS_HOME / "skills"
-    if skills_dir.exists():
-        skills = list(skills_dir.glob("*/SKILL.md"))
+    if SKILLS_DIR.exists():
+        skills = [d for d in list_subdirs(SKILLS_DIR) if (d / "SKILL.md").exists()]
         console.print(f"[cyan]Skills:[/cyan] {len(skills)}")
 
 
@@ -1974,11 +2285,14 @@ def rebuild_cmd():
     ]:
         comp_dir = opencode_dir / subdir
         if comp_dir.exists():
-            result = subprocess.run(
-                ["find", "-L", str(comp_dir), "-name", pattern.split("/")[-1], "-type", "f"],
-                capture_output=True, text=True
-            )
-            count = len(result.stdout.strip().split("\n")) if result.stdout.strip() else 0
+            if comp_name == "skills":
+                count = sum(1 for _ in walk_skill_dirs(comp_dir))
+            else:
+                result = subprocess.run(
+                    ["find", "-L", str(comp_dir), "-name", pattern.split("/")[-1], "-type", "f"],
+                    capture_output=True, text=True
+                )
+                count = len(result.stdout.strip().split("\n")) if result.stdout.strip() else 0
             console.print(f"  Total {comp_name}: {count}")
 
 
@@ -2014,7 +2328,6 @@ def sanitize_yaml_frontmatter(file_path: Path) -> bool:
         frontmatter = content[3:end_idx]
         rest = content[end_idx:]
         
-        import re
         original_fm = frontmatter
         
         # Remove lines that are just "fieldname:" with nothing after
@@ -2064,17 +2377,17 @@ def sanitize_plugin_cache() -> Dict[str, int]:
     
     Returns dict with counts: {"scanned": int, "fixed": int}
     """
-    cache_dir = AGENT_PLUGINS_HOME / "plugins" / "cache"
+    cache_dir = PLUGIN_CACHE_DIR
     results = {"scanned": 0, "fixed": 0, "files_fixed": []}
     
     if not cache_dir.exists():
         return results
     
-    for md_file in cache_dir.rglob("*.md"):
+    for md_file, rel_path in walk_md_files(cache_dir):
         results["scanned"] += 1
         if sanitize_yaml_frontmatter(md_file):
             results["fixed"] += 1
-            results["files_fixed"].append(str(md_file.relative_to(cache_dir)))
+            results["files_fixed"].append(str(rel_path))
     
     return results
 
@@ -2166,14 +2479,16 @@ def import_cmd(
     # Extract hooks and rebuild OpenCode structure if we imported something
     if extract_after and results["imported"]:
         console.print("\n[cyan]Extracting hooks from imported marketplaces...[/cyan]")
-        hooks = extract_hooks_from_marketplaces()
+        hooks = extract_hooks_from_marketplaces(only=set(results["imported"]))
         console.print(f"[green]✓[/green] Extracted {hooks} hooks")
         
         # Rebuild OpenCode structure (commands, agents, skills via symlinks)
         console.print("\n[cyan]Rebuilding OpenCode structure...[/cyan]")
         oc_results = build_opencode_structure()
-        total_mp = sum(r["marketplace"] for r in oc_results.values())
+        total_mp = sum(oc_results[comp]["marketplace"] for comp in ["commands", "agents", "skills"])
         console.print(f"[green]✓[/green] Linked {total_mp} marketplace components")
+    elif extract_after:
+        console.print("[dim]Skipping extraction (no new marketplaces)[/dim]")
     
     total_imported = len(results["imported"])
     if total_imported > 0:
@@ -2182,9 +2497,97 @@ def import_cmd(
         console.print("\n[dim]No new marketplaces to import.[/dim]")
 
 
+COMPONENT_HEAD_BYTES = 2048
+_DESCRIPTION_RE = re.compile(r"^description:[ \t]*(.+?)[ \t]*$", re.M)
+# Plain scalars starting with these may be indicators, numbers or nulls to yaml
+_YAML_SPECIAL_FIRST = "-?:,[]{}#&*!|>'\"%@`~+.0123456789"
+# Plain scalars yaml resolves to null or bool rather than a string
+_YAML_KEYWORDS = frozenset(
+    "~ null Null NULL true True TRUE false False FALSE "
+    "yes Yes YES no No NO on On ON off Off OFF".split()
+)
+
+
+def list_md_files(directory: Path) -> List[Path]:
+    """List a directory's .md files sorted by name (missing dir -> []).
+    
+    The suffix check runs on the names from a single scandir, so no
+    entry is stat'ed.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            names = sorted(entry.name for entry in entries if entry.name.endswith(".md"))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return [directory / name for name in names]
+
+
+def read_component_head(path: Path) -> str:
+    """Read the first COMPONENT_HEAD_BYTES bytes of a component file.
+    
+    Unbuffered binary read: a single read() of just the prefix, where a
+    text-mode file would fill (and decode) a full 8 KiB buffer first.
+    Newlines are translated as text mode would, so CRLF files don't leave
+    a trailing carriage return on parsed values.
+    """
+    with open(path, "rb", buffering=0) as f:
+        head = f.read(COMPONENT_HEAD_BYTES).decode("utf-8", errors="replace")
+    if "\r" in head:
+        head = head.replace("\r\n", "\n").replace("\r", "\n")
+    return head
+
+
+def first_description_line(head: str) -> str:
+    """Get the first line that isn't blank, a heading or a frontmatter fence."""
+    return next(
+        (line for line in map(str.strip, head.splitlines())
+         if line and not line.startswith(("#", "---"))),
+        ""
+    )[:80]
+
+
+def frontmatter_description(path: Path, head: str) -> str:
+    """Get the description field from a file's YAML frontmatter.
+    
+    Plain and simply quoted `description: value` lines are matched with a
+    precompiled regex directly in the head. Anything yaml might read
+    differently (block scalars, escapes, comments, nested colons,
+    null/bool/number literals) and frontmatter longer than the head fall
+    back to reading the whole file and parsing it with yaml.
+    """
+    if not head.startswith("---"):
+        return ""
+    end = head.find("\n---", 3)
+    if end != -1:
+        match = _DESCRIPTION_RE.search(head, 3, end)
+        if not match:
+            return ""
+        value = match.group(1)
+        if (value[0] not in _YAML_SPECIAL_FIRST and "#" not in value
+                and ":" not in value and value not in _YAML_KEYWORDS):
+            return value[:80]
+        quote = value[0]
+        if quote in "'\"" and len(value) > 1 and value[-1] == quote:
+            inner = value[1:-1]
+            if quote not in inner and "\\" not in inner:
+                return inner[:80]
+    
+    import yaml
+    
+    parts = path.read_text().split("---", 2)
+    if len(parts) >= 3:
+        frontmatter = yaml.safe_load(parts[1])
+        if frontmatter and isinstance(frontmatter, dict):
+            return frontmatter.get("description", "")[:80]
+    return ""
+
+
 def get_all_components() -> Dict[str, List[Dict[str, Any]]]:
     """Get all installed components (skills, commands, agents, hooks).
     
+    Only the first COMPONENT_HEAD_BYTES of each file are read to find
+    its description.
+    
     Returns dict with lists of component info:
     {
         "skills": [{"name": "...", "path": Path, "description": "..."}],
@@ -2201,89 +2604,167 @@ def get_all_components() -> Dict[str, List[Dict[str, Any]]]:
     }
     
     # Skills
-    skills_dir = AGENT_PLUGINS_HOME / "skills"
-    if skills_dir.exists():
-        for f in sorted(skills_dir.glob("*.md")):
-            desc = ""
-            try:
-                content = f.read_text()
-                # Try to extract first line or description
-                lines = content.strip().split("\n")
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.startswith("#") and not line.startswith("---"):
-                        desc = line[:80]
-                        break
-            except Exception:
-                pass
-            components["skills"].append({
-                "name": f.stem,
-                "path": f,
-                "description": desc,
-                "type": "skill",
-            })
+    for f in list_md_files(SKILLS_DIR):
+        desc = ""
+        try:
+            # Try to extract first line or description
+            desc = first_description_line(read_component_head(f))
+        except Exception:
+            pass
+        components["skills"].append({
+            "name": f.stem,
+            "path": f,
+            "description": desc,
+            "type": "skill",
+        })
     
     # Commands
-    commands_dir = AGENT_PLUGINS_HOME / "commands"
-    if commands_dir.exists():
-        for f in sorted(commands_dir.glob("*.md")):
-            desc = ""
-            try:
-                content = f.read_text()
-                # Try to extract description from frontmatter
-                if content.startswith("---"):
-                    import yaml
-                    parts = content.split("---", 2)
-                    if len(parts) >= 3:
-                        frontmatter = yaml.safe_load(parts[1])
-                        if frontmatter and isinstance(frontmatter, dict):
-                            desc = frontmatter.get("description", "")[:80]
-            except Exception:
-                pass
-            components["commands"].append({
-                "name": f.stem,
-                "path": f,
-                "description": desc,
-                "type": "command",
-            })
+    for f in list_md_files(COMMANDS_DIR):
+        desc = ""
+        try:
+            # Try to extract description from frontmatter
+            desc = frontmatter_description(f, read_component_head(f))
+        except Exception:
+            pass
+        components["commands"].append({
+            "name": f.stem,
+            "path": f,
+            "description": desc,
+            "type": "command",
+        })
     
     # Agents
-    agents_dir = AGENT_PLUGINS_HOME / "agents"
-    if agents_dir.exists():
-        for f in sorted(agents_dir.glob("*.md")):
-            desc = ""
-            try:
-                content = f.read_text()
-                lines = content.strip().split("\n")
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.startswith("#") and not line.startswith("---"):
-                        desc = line[:80]
-                        break
-            except Exception:
-                pass
-            components["agents"].append({
-                "name": f.stem,
-                "path": f,
-                "description": desc,
-                "type": "agent",
-            })
+    for f in list_md_files(AGENTS_DIR):
+        desc = ""
+        try:
+            desc = first_description_line(read_component_head(f))
+        except Exception:
+            pass
+        components["agents"].append({
+            "name": f.stem,
+            "path": f,
+            "description": desc,
+            "type": "agent",
+        })
     
     # Hooks
-    hooks_dir = AGENT_PLUGINS_HOME / "hooks"
-    if hooks_dir.exists():
-        for f in sorted(hooks_dir.iterdir()):
-            if f.is_file() and not f.name.startswith("."):
-                components["hooks"].append({
-                    "name": f.name,
-                    "path": f,
-                    "description": "",
-                    "type": "hook",
-                })
+    hooks_dir = HOOKS_DIR
+    try:
+        with os.scandir(hooks_dir) as entries:
+            hook_names = sorted(
+                entry.name for entry in entries
+                if not entry.name.startswith(".") and entry.is_file()
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        hook_names = []
+    for name in hook_names:
+        components["hooks"].append({
+            "name": name,
+            "path": hooks_dir / name,
+            "description": "",
+            "type": "hook",
+        })
+    
+    # Lowercased once here so searches don't re-lower every item per query
+    for items in components.values():
+        for item in items:
+            item["name_lower"] = item["name"].lower()
+            item["description_lower"] = item["description"].lower()
     
     return components
 
 
+def file_matches(path: Path, pattern: "re.Pattern") -> bool:
+    """Check whether a file's text contains a match for pattern (unreadable -> False)."""
+    try:
+        return pattern.search(path.read_text()) is not None
+    except Exception:
+        return False
+
+
+COMPONENT_TYPES = ("skills", "commands", "agents", "hooks")
+COMPONENT_INDEX_VERSION = 2  # Bump when get_all_components() items change shape
+
+
+def get_component_index_path() -> Path:
+    """Get the path to the component index cache."""
+    return AGENT_PLUGINS_HOME / ".index.json"
+
+
+def get_component_stamps() -> Dict[str, Optional[Dict[str, Optional[List[int]]]]]:
+    """Get [st_mtime_ns, st_size] of each component file, by type and name.
+    
+    One scandir per component directory (None if the directory is
+    missing). Adding, removing, renaming or rewriting a component file
+    changes the result.
+    """
+    stamps = {}
+    for comp_type in COMPONENT_TYPES:
+        files = {}
+        try:
+            with os.scandir(AGENT_PLUGINS_HOME / comp_type) as entries:
+                for entry in entries:
+                    if comp_type == "hooks":
+                        if entry.name.startswith("."):
+                            continue
+                    elif not entry.name.endswith(".md"):
+                        continue
+                    try:
+                        st = entry.stat()
+                        files[entry.name] = [st.st_mtime_ns, st.st_size]
+                    except OSError:
+                        files[entry.name] = None  # e.g. a dangling symlink
+        except (FileNotFoundError, NotADirectoryError):
+            files = None
+        stamps[comp_type] = files
+    return stamps
+
+
+def load_component_index() -> Dict[str, List[Dict[str, Any]]]:
+    """Get all components, from ~/.agent/.index.json while it's still valid.
+    
+    The index records the mtime and size of every component file; adding,
+    removing, renaming or editing a component changes them and triggers a
+    rebuild via get_all_components().
+    
+    Returns the same structure as get_all_components().
+    """
+    index_path = get_component_index_path()
+    stamps = get_component_stamps()
+    
+    try:
+        index = json_loads(index_path.read_bytes())
+        if index.get("version") == COMPONENT_INDEX_VERSION and index.get("stamps") == stamps:
+            return {
+                comp_type: [{**item, "path": Path(item["path"])} for item in items]
+                for comp_type, items in index["components"].items()
+            }
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+        pass
+    
+    components = get_all_components()
+    try:
+        index_path.write_text(json.dumps({
+            "version": COMPONENT_INDEX_VERSION,
+            "stamps": stamps,
+            "components": {
+                comp_type: [{**item, "path": str(item["path"])} for item in items]
+                for comp_type, items in components.items()
+            },
+        }))
+    except OSError:
+        pass
+    return components
+
+
+def invalidate_component_index():
+    """Drop the component index so the next lookup rebuilds it."""
+    try:
+        get_component_index_path().unlink()
+    except FileNotFoundError:
+        pass
+
+
 @app.command(name="list")
 def list_components(
     component_type: Optional[str] = typer.Argument(
@@ -2315,7 +2796,7 @@ def list_components(
         console.print(f"Valid types: {', '.join(valid_types)}")
         raise typer.Exit(1)
     
-    components = get_all_components()
+    components = load_component_index()
     
     # Filter if type specified
     if component_type:
@@ -2428,6 +2909,7 @@ def show_component(
     # Find the component
     found_path = None
     found_type = None
+    name_lower = name.lower()
     
     for comp_type in search_order:
         comp_dir = AGENT_PLUGINS_HOME / comp_type
@@ -2435,28 +2917,60 @@ def show_component(
             # Try exact match first
             for ext in [".md", ""]:
                 candidate = comp_dir / f"{name}{ext}"
-                if candidate.exists():
+                if candidate.is_file():
                     found_path = candidate
                     found_type = comp_type
                     break
             if found_path:
                 break
-            
-            # Try case-insensitive match
-            for f in comp_dir.iterdir():
-                if f.stem.lower() == name.lower():
-                    found_path = f
+    
+    if not found_path:
+        # Try case-insensitive match against the component index
+        index = load_component_index()
+        for comp_type in search_order:
+            for item in index.get(comp_type, []):
+                if item["name"].lower() == name_lower:
+                    found_path = item["path"]
                     found_type = comp_type
                     break
             if found_path:
                 break
     
+    if not found_path:
+        # Fall back to any file in the component dirs (e.g. non-.md files)
+        for comp_type in search_order:
+            comp_dir = AGENT_PLUGINS_HOME / comp_type
+            if not comp_dir.exists():
+                continue
+            
+            # Compare stems straight from scandir names
+            with os.scandir(comp_dir) as entries:
+                for entry in entries:
+                    stem = entry.name.rpartition(".")[0] or entry.name
+                    if stem.lower() == name_lower:
+                        found_path = Path(entry.path)
+                        found_type = comp_type
+                        break
+            if found_path:
+                break
+    
     if not found_path:
         console.print(f"[red]Error:[/red] Component '{name}' not found")
         console.print(f"\n[dim]Searched in: {', '.join(search_order)}[/dim]")
         console.print(f"[dim]Use 'agent-plugins list' to see available components[/dim]")
         raise typer.Exit(1)
     
+    # Raw output: write the bytes straight through, no decoding or markup parsing
+    if raw:
+        try:
+            data = found_path.read_bytes()
+        except Exception as e:
+            console.print(f"[red]Error reading file:[/red] {e}")
+            raise typer.Exit(1)
+        sys.stdout.buffer.write(data if data.endswith(b"\n") else data + b"\n")
+        sys.stdout.flush()
+        return
+    
     # Read content
     try:
         content = found_path.read_text()
@@ -2464,28 +2978,24 @@ def show_component(
         console.print(f"[red]Error reading file:[/red] {e}")
         raise typer.Exit(1)
     
-    # Output
-    if raw:
-        console.print(content)
+    # Formatted output: show header
+    type_label = found_type.rstrip("s").capitalize()
+    console.print(f"\n[bold cyan]{type_label}:[/bold cyan] [green]{found_path.stem}[/green]")
+    console.print(f"[dim]{found_path}[/dim]\n")
+    
+    # Render markdown or show syntax-highlighted content
+    if found_path.suffix == ".md":
+        try:
+            md = Markdown(content)
+            console.print(Panel(md, border_style="dim"))
+        except Exception:
+            console.print(content)
     else:
-        # Show header
-        type_label = found_type.rstrip("s").capitalize()
-        console.print(f"\n[bold cyan]{type_label}:[/bold cyan] [green]{found_path.stem}[/green]")
-        console.print(f"[dim]{found_path}[/dim]\n")
-        
-        # Render markdown or show syntax-highlighted content
-        if found_path.suffix == ".md":
-            try:
-                md = Markdown(content)
-                console.print(Panel(md, border_style="dim"))
-            except Exception:
-                console.print(content)
-        else:
-            try:
-                syntax = Syntax(content, "text", theme="monokai", line_numbers=True)
-                console.print(syntax)
-            except Exception:
-                console.print(content)
+        try:
+            syntax = Syntax(content, "text", theme="monokai", line_numbers=True)
+            console.print(syntax)
+        except Exception:
+            console.print(content)
 
 
 @app.command(name="search")
@@ -2512,8 +3022,6 @@ def search_components(
         agent-plugins search test -t skill # Search only skills
         agent-plugins search TODO -c       # Search in file contents too
     """
-    import re
-    
     valid_types = ["skills", "commands", "agents", "hooks"]
     
     if component_type:
@@ -2522,7 +3030,7 @@ def search_components(
             console.print(f"Valid types: {', '.join(valid_types)}")
             raise typer.Exit(1)
     
-    components = get_all_components()
+    components = load_component_index()
     
     # Filter by type if specified
     if component_type:
@@ -2532,34 +3040,39 @@ def search_components(
     query_pattern = re.compile(re.escape(query), re.IGNORECASE)
     
     results = []
+    unmatched = []
     
     for comp_type, items in components.items():
         for item in items:
             match_in = []
             
             # Search in name
-            if query_lower in item["name"].lower():
+            if query_lower in item["name_lower"]:
                 match_in.append("name")
             
             # Search in description
-            if item["description"] and query_lower in item["description"].lower():
+            if query_lower in item["description_lower"]:
                 match_in.append("description")
             
-            # Search in content if requested
-            if content and item["path"].exists():
-                try:
-                    file_content = item["path"].read_text()
-                    if query_pattern.search(file_content):
-                        if "name" not in match_in and "description" not in match_in:
-                            match_in.append("content")
-                except Exception:
-                    pass
-            
             if match_in:
                 results.append({
                     **item,
                     "match_in": match_in,
                 })
+            else:
+                unmatched.append(item)
+    
+    # Search in content if requested (only matters when nothing else matched).
+    # Reads are I/O-bound, so files are searched concurrently.
+    if content and unmatched:
+        with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(unmatched))) as executor:
+            hits = executor.map(lambda item: file_matches(item["path"], query_pattern), unmatched)
+            for item, hit in zip(unmatched, hits):
+                if hit:
+                    results.append({
+                        **item,
+                        "match_in": ["content"],
+                    })
     
     # Sort results: name matches first, then description, then content
     def sort_key(r):
@@ -2587,18 +3100,21 @@ def search_components(
     
     console.print(f"\n[bold cyan]Search Results for '{query}'[/bold cyan] ({len(results)} found)\n")
     
+    # Build every result line first and render them with a single print
+    type_colors = {"skill": "yellow", "command": "blue", "agent": "magenta", "hook": "cyan"}
+    lines = []
     for item in results:
         type_label = item["type"]
-        type_color = {"skill": "yellow", "command": "blue", "agent": "magenta", "hook": "cyan"}.get(type_label, "white")
+        type_color = type_colors.get(type_label, "white")
         
         match_str = ", ".join(item["match_in"])
         
-        console.print(f"  [{type_color}]{type_label}[/{type_color}] [green]{item['name']}[/green] [dim](match: {match_str})[/dim]")
+        lines.append(f"  [{type_color}]{type_label}[/{type_color}] [green]{item['name']}[/green] [dim](match: {match_str})[/dim]")
         if item["description"]:
-            # Highlight query in description
-            desc = item["description"]
-            highlighted = query_pattern.sub(f"[bold yellow]{query}[/bold yellow]", desc)
-            console.print(f"       [dim]{highlighted}[/dim]")
+            # Highlight query in description (keeping the matched text's case)
+            highlighted = query_pattern.sub(r"[bold yellow]\g<0>[/bold yellow]", item["description"])
+            lines.append(f"       [dim]{highlighted}[/dim]")
+    console.print("\n".join(lines))
     
     if truncated:
         console.print(f"\n[dim]... and more. Use --limit to show more results.[/dim]")
@@ -2610,40 +3126,52 @@ def search_components(
 # Plugin Commands (mirrors 'claude plugin')
 # =============================================================================
 
+_marketplace_json_cache: Dict[str, tuple] = {}  # path -> ((mtime_ns, size), parsed data)
+
+
+def load_marketplace_json(mp_json: Path) -> Dict[str, Any]:
+    """Load a marketplace.json, cached per process and validated by mtime and size.
+    
+    The size check catches rewrites within the filesystem's mtime
+    granularity. A changed file replaces its cache entry rather than
+    adding another. Raises FileNotFoundError if the file doesn't exist.
+    """
+    key = str(mp_json)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _marketplace_json_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    mp_data = json_loads(mp_json.read_bytes())
+    _marketplace_json_cache[key] = (stamp, mp_data)
+    return mp_data
+
+
 def get_available_plugins() -> List[Dict[str, Any]]:
-    """Get all available plugins from all marketplaces."""
-    plugins = []
+    """Get all available plugins from all marketplaces.
     
-    # Check both agent-plugins and Claude directories
-    mp_dirs = [
-        AGENT_PLUGINS_HOME / "plugins" / "marketplaces",
-        Path.home() / ".claude" / "plugins" / "marketplaces",
-    ]
+    Marketplaces come from get_all_marketplace_dirs(), which already scans
+    both the agent-plugins and Claude directories (first location wins).
+    """
+    plugins = []
     
     seen = set()
-    for mp_base in mp_dirs:
-        if not mp_base.exists():
-            continue
-        for mp_dir in mp_base.iterdir():
-            if not mp_dir.is_dir() or mp_dir.name.startswith("."):
-                continue
-            
-            mp_json = mp_dir / ".claude-plugin" / "marketplace.json"
-            if mp_json.exists():
-                try:
-                    with open(mp_json) as f:
-                        mp_data = json.load(f)
-                    for plugin in mp_data.get("plugins", []):
-                        plugin_key = f"{plugin.get('name')}@{mp_dir.name}"
-                        if plugin_key not in seen:
-                            seen.add(plugin_key)
-                            plugins.append({
-                                **plugin,
-                                "marketplace": mp_dir.name,
-                                "marketplace_path": mp_dir,
-                            })
-                except Exception:
-                    pass
+    for mp_dir in get_all_marketplace_dirs():
+        mp_json = mp_dir / ".claude-plugin" / "marketplace.json"
+        try:
+            mp_data = load_marketplace_json(mp_json)
+            for plugin in mp_data.get("plugins", []):
+                plugin_key = f"{plugin.get('name')}@{mp_dir.name}"
+                if plugin_key not in seen:
+                    seen.add(plugin_key)
+                    plugins.append({
+                        **plugin,
+                        "marketplace": mp_dir.name,
+                        "marketplace_path": mp_dir,
+                    })
+        except Exception:
+            pass
     
     return plugins
 
@@ -2654,9 +3182,13 @@ def get_installed_plugins() -> Dict[str, Any]:
     return config.get("installed_plugins", {})
 
 
-def save_installed_plugins(plugins: Dict[str, Any]):
-    """Save installed plugins to config."""
-    config = load_config()
+def save_installed_plugins(plugins: Dict[str, Any], config: Optional[Dict[str, Any]] = None):
+    """Save installed plugins to config.
+    
+    Pass the config the plugins were read from to avoid loading it again.
+    """
+    if config is None:
+        config = load_config()
     config["installed_plugins"] = plugins
     save_config(config)
 
@@ -2712,30 +3244,28 @@ def plugin_install(
     # Determine plugin source path
     source = plugin_info.get("source", f"./{plugin_name}")
     if isinstance(source, str) and source.startswith("./"):
-        plugin_path = mp_path / source.lstrip("./")
+        primary = mp_path / source.lstrip("./")
     else:
-        plugin_path = mp_path / "plugins" / plugin_name
+        primary = mp_path / "plugins" / plugin_name
     
-    if not plugin_path.exists():
-        # Try alternate locations
-        for alt in [mp_path / plugin_name, mp_path / "skills" / plugin_name]:
-            if alt.exists():
-                plugin_path = alt
-                break
+    # Primary location first, then alternates; stop at the first that exists
+    candidates = (primary, mp_path / plugin_name, mp_path / "skills" / plugin_name)
+    plugin_path = next((c for c in candidates if c.exists()), None)
     
-    if not plugin_path.exists():
-        console.print(f"[red]Error:[/red] Plugin source not found at {plugin_path}")
+    if plugin_path is None:
+        console.print(f"[red]Error:[/red] Plugin source not found at {primary}")
         raise typer.Exit(1)
     
     # Track installation
-    installed = get_installed_plugins()
+    config = load_config()
+    installed = config.get("installed_plugins", {})
     installed[plugin_name] = {
         "marketplace": mp_name,
         "source": str(plugin_path),
         "version": plugin_info.get("version", "unknown"),
         "scope": scope,
     }
-    save_installed_plugins(installed)
+    save_installed_plugins(installed, config)
     
     console.print(f"[green]✓[/green] Installed {plugin_name}@{mp_name}")
     
@@ -2749,14 +3279,15 @@ def plugin_uninstall(
     plugin: str = typer.Argument(..., help="Plugin name to uninstall"),
 ):
     """Uninstall an installed plugin."""
-    installed = get_installed_plugins()
+    config = load_config()
+    installed = config.get("installed_plugins", {})
     
     if plugin not in installed:
         console.print(f"[red]Error:[/red] Plugin '{plugin}' is not installed")
         raise typer.Exit(1)
     
     del installed[plugin]
-    save_installed_plugins(installed)
+    save_installed_plugins(installed, config)
     
     console.print(f"[green]✓[/green] Uninstalled {plugin}")
 
@@ -2774,62 +3305,66 @@ def plugin_list():
     installed = get_installed_plugins()
     available = get_available_plugins()
     
+    # Collect every line and print once; per-line console.print dominated
+    # the cost for large marketplaces
+    lines = []
     if installed:
-        console.print("\n[bold]Installed plugins:[/bold]\n")
+        lines.append("\n[bold]Installed plugins:[/bold]\n")
         for name, info in installed.items():
-            console.print(f"  [green]✓[/green] [bold]{name}[/bold]@{info.get('marketplace', 'unknown')}")
+            lines.append(f"  [green]✓[/green] [bold]{name}[/bold]@{info.get('marketplace', 'unknown')}")
             if info.get("version"):
-                console.print(f"    [dim]Version: {info.get('version')}[/dim]")
+                lines.append(f"    [dim]Version: {info.get('version')}[/dim]")
     
-    console.print("\n[bold]Available plugins:[/bold]\n")
+    lines.append("\n[bold]Available plugins:[/bold]\n")
     
     # Group by marketplace
     by_marketplace: Dict[str, List] = {}
     for p in available:
-        mp = p.get("marketplace", "unknown")
-        if mp not in by_marketplace:
-            by_marketplace[mp] = []
-        by_marketplace[mp].append(p)
+        by_marketplace.setdefault(p.get("marketplace", "unknown"), []).append(p)
     
     for mp, plugins in sorted(by_marketplace.items()):
-        console.print(f"  [cyan]{mp}[/cyan]")
+        lines.append(f"  [cyan]{mp}[/cyan]")
         for p in plugins[:5]:  # Show first 5
             name = p.get("name", "unknown")
             desc = p.get("description", "")[:50]
             installed_marker = "[green]✓[/green] " if name in installed else "  "
-            console.print(f"    {installed_marker}{name}")
+            lines.append(f"    {installed_marker}{name}")
             if desc:
-                console.print(f"      [dim]{desc}[/dim]")
+                lines.append(f"      [dim]{desc}[/dim]")
         if len(plugins) > 5:
-            console.print(f"    [dim]... and {len(plugins) - 5} more[/dim]")
-        console.print()
+            lines.append(f"    [dim]... and {len(plugins) - 5} more[/dim]")
+        lines.append("")
+    
+    console.print("\n".join(lines))
 
 
 @plugin_app.command("enable")
 def plugin_enable(plugin: str = typer.Argument(..., help="Plugin name to enable")):
     """Enable a disabled plugin."""
-    installed = get_installed_plugins()
+    config = load_config()
+    installed = config.get("installed_plugins", {})
     
     if plugin not in installed:
         console.print(f"[red]Error:[/red] Plugin '{plugin}' is not installed")
         raise typer.Exit(1)
     
     installed[plugin]["enabled"] = True
-    save_installed_plugins(installed)
+    save_installed_plugins(installed, config)
     console.print(f"[green]✓[/green] Enabled {plugin}")
 
 
 @plugin_app.command("disable")
 def plugin_disable(plugin: str = typer.Argument(..., help="Plugin name to disable")):
     """Disable an enabled plugin."""
-    installed = get_installed_plugins()
+    config = load_config()
+    installed = config.get("installed_plugins", {})
     
     if plugin not in installed:
         console.print(f"[red]Error:[/red] Plugin '{plugin}' is not installed")
         raise typer.Exit(1)
     
     installed[plugin]["enabled"] = False
-    save_installed_plugins(installed)
+    save_installed_plugins(installed, config)
     console.print(f"[green]✓[/green] Disabled {plugin}")
 
 
@@ -2853,7 +3388,7 @@ def marketplace_add(
         agent-plugins marketplace add https://github.com/user/my-plugins.git
         agent-plugins marketplace add user/private-repo --github-token ghp_xxx
     """
-    marketplaces_dir = AGENT_PLUGINS_HOME / "plugins" / "marketplaces"
+    marketplaces_dir = MARKETPLACES_DIR
     marketplaces_dir.mkdir(parents=True, exist_ok=True)
     
     # Parse source
@@ -2886,6 +3421,7 @@ def marketplace_add(
             capture_output=True,
             text=True
         )
+        get_all_marketplace_dirs.cache_clear()
         console.print(f"[green]✓[/green] Added marketplace: {repo_name}")
         
         # Add to known_marketplaces.json for Claude compatibility
@@ -2895,11 +3431,11 @@ def marketplace_add(
         
         # Show what was added
         mp_json = target_dir / ".claude-plugin" / "marketplace.json"
-        if mp_json.exists():
-            with open(mp_json) as f:
-                mp_data = json.load(f)
-            plugins = mp_data.get("plugins", [])
+        try:
+            plugins = load_marketplace_json(mp_json).get("plugins", [])
             console.print(f"  Contains {len(plugins)} plugin(s)")
+        except FileNotFoundError:
+            pass
         
     except subprocess.CalledProcessError as e:
         console.print(f"[red]Error cloning repository:[/red] {e.stderr}")
@@ -2911,7 +3447,7 @@ def marketplace_remove(
     name: str = typer.Argument(..., help="Marketplace name to remove"),
 ):
     """Remove an installed marketplace."""
-    marketplaces_dir = AGENT_PLUGINS_HOME / "plugins" / "marketplaces"
+    marketplaces_dir = MARKETPLACES_DIR
     target_dir = marketplaces_dir / name
     
     if not target_dir.exists():
@@ -2919,6 +3455,7 @@ def marketplace_remove(
         raise typer.Exit(1)
     
     shutil.rmtree(target_dir)
+    get_all_marketplace_dirs.cache_clear()
     
     # Remove from known_marketplaces.json
     known = load_known_marketplaces()
@@ -2935,39 +3472,92 @@ def marketplace_update(
     name: Optional[str] = typer.Argument(None, help="Marketplace name (or all if not specified)"),
 ):
     """Update marketplace(s) from their git source."""
-    marketplaces_dir = AGENT_PLUGINS_HOME / "plugins" / "marketplaces"
+    marketplaces_dir = MARKETPLACES_DIR
     
     if name:
         targets = [marketplaces_dir / name]
     else:
-        targets = [d for d in marketplaces_dir.iterdir() if d.is_dir() and (d / ".git").exists()]
+        targets = [d for d in list_subdirs(marketplaces_dir) if (d / ".git").exists()]
     
+    existing = []
     for target in targets:
         if not target.exists():
             console.print(f"[yellow]Skipping {target.name}: not found[/yellow]")
             continue
-        
-        console.print(f"[cyan]Updating {target.name}...[/cyan]")
-        try:
-            subprocess.run(
-                ["git", "pull", "--ff-only"],
-                cwd=target,
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            console.print(f"[green]✓[/green] Updated {target.name}")
-        except subprocess.CalledProcessError as e:
-            console.print(f"[red]Error updating {target.name}:[/red] {e.stderr}")
+        existing.append(target)
+    
+    if not existing:
+        return
+    
+    # Pull in parallel - each pull is network-bound; report as they finish
+    console.print(f"[cyan]Updating {', '.join(t.name for t in existing)}...[/cyan]")
+    failed = []
+    with ThreadPoolExecutor(max_workers=min(MAX_GIT_WORKERS, len(existing))) as executor:
+        futures = {executor.submit(pull_marketplace_repo, target): target for target in existing}
+        for future in as_completed(futures):
+            target = futures[future]
+            error = future.result()
+            if error is None:
+                console.print(f"[green]✓[/green] Updated {target.name}")
+            else:
+                failed.append(target.name)
+                console.print(f"[red]Error updating {target.name}:[/red] {error}")
+    
+    if failed and len(existing) > 1:
+        console.print(f"[yellow]⚠[/yellow] Failed to update: {', '.join(sorted(failed))}")
+
+
+def pull_marketplace_repo(target: Path) -> Optional[str]:
+    """Fast-forward a marketplace checkout with git pull.
+    
+    Safe to call from worker threads: nothing is printed here.
+    
+    Returns None on success, or git's error output on failure.
+    """
+    try:
+        subprocess.run(
+            ["git", "pull", "--ff-only"],
+            cwd=target,
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        return None
+    except subprocess.CalledProcessError as e:
+        return str(e.stderr)
+
+
+_GIT_ORIGIN_RE = re.compile(r'^\[remote "origin"\][^\n]*\n(.*?)(?=^\[|\Z)', re.M | re.S)
+_GIT_URL_RE = re.compile(r"^\s*url\s*=\s*(.+?)\s*$", re.M)
+GITHUB_URL_RE = re.compile(r"github\.com[:/](.+?)(?:\.git)?/?$")
+
+
+def get_git_remote_url(repo_dir: Path) -> Optional[str]:
+    """Get a checkout's remote URL straight from .git/config.
+    
+    Prefers remote "origin", falling back to the first url in the file.
+    Reading the small config file is ~100x cheaper than spawning
+    `git config --get remote.origin.url`.
+    """
+    try:
+        content = (repo_dir / ".git" / "config").read_text()
+    except (OSError, UnicodeDecodeError):
+        return None
+    
+    origin = _GIT_ORIGIN_RE.search(content)
+    match = _GIT_URL_RE.search(origin.group(1)) if origin else None
+    if not match:
+        match = _GIT_URL_RE.search(content)
+    return match.group(1) if match else None
 
 
 @marketplace_app.command(name="list")
 def marketplace_list():
     """List all configured marketplaces."""
-    marketplaces_dir = AGENT_PLUGINS_HOME / "plugins" / "marketplaces"
+    marketplaces_dir = MARKETPLACES_DIR
     
     # Also check Claude's marketplace directory
-    claude_mp_dir = Path.home() / ".claude" / "plugins" / "marketplaces"
+    claude_mp_dir = CLAUDE_MARKETPLACES_DIR
     
     if not marketplaces_dir.exists() and not claude_mp_dir.exists():
         console.print("[yellow]No marketplaces directory. Run 'agent-plugins init' first.[/yellow]")
@@ -2975,50 +3565,32 @@ def marketplace_list():
     
     console.print("\n[bold]Configured marketplaces:[/bold]\n")
     
-    seen = set()
+    # Agent-plugins directory first, then Claude's (if different); first name wins
+    bases = [marketplaces_dir]
+    if claude_mp_dir != marketplaces_dir:
+        bases.append(claude_mp_dir)
     
-    def print_marketplace(mp_dir: Path):
-        if mp_dir.name in seen or mp_dir.name.startswith("."):
-            return
-        seen.add(mp_dir.name)
-        
-        # Determine source type
-        git_config = mp_dir / ".git" / "config"
-        source_info = "Local"
-        
-        if git_config.exists():
-            try:
-                with open(git_config) as f:
-                    content = f.read()
-                    if "url = " in content:
-                        for line in content.split("\n"):
-                            if "url = " in line:
-                                url = line.split("url = ")[1].strip()
-                                if "github.com" in url:
-                                    # Extract owner/repo from GitHub URL
-                                    parts = url.replace(".git", "").split("github.com")[-1].strip("/:")
-                                    source_info = f"GitHub ({parts})"
-                                else:
-                                    source_info = f"Git ({url})"
-                                break
-            except Exception:
-                pass
-        
-        console.print(f"  [cyan]❯[/cyan] [bold]{mp_dir.name}[/bold]")
-        console.print(f"    [dim]Source: {source_info}[/dim]")
-        console.print()
-    
-    # List from agent-plugins directory
-    if marketplaces_dir.exists():
-        for mp_dir in sorted(marketplaces_dir.iterdir()):
-            if mp_dir.is_dir():
-                print_marketplace(mp_dir)
-    
-    # List from Claude's directory (if different)
-    if claude_mp_dir.exists() and claude_mp_dir != marketplaces_dir:
-        for mp_dir in sorted(claude_mp_dir.iterdir()):
-            if mp_dir.is_dir():
-                print_marketplace(mp_dir)
+    seen = set()
+    for mp_base in bases:
+        for mp_dir in list_subdirs(mp_base):
+            if mp_dir.name in seen or mp_dir.name.startswith("."):
+                continue
+            seen.add(mp_dir.name)
+            
+            # Determine source type
+            source_info = "Local"
+            url = get_git_remote_url(mp_dir)
+            if url:
+                github = GITHUB_URL_RE.search(url)
+                if github:
+                    # Extract owner/repo from GitHub URL
+                    source_info = f"GitHub ({github.group(1)})"
+                else:
+                    source_info = f"Git ({url})"
+            
+            console.print(f"  [cyan]❯[/cyan] [bold]{mp_dir.name}[/bold]")
+            console.print(f"    [dim]Source: {source_info}[/dim]")
+            console.print()
 
 
 # =============================================================================
@@ -3041,13 +3613,16 @@ def add_skill(
         raise typer.Exit(1)
     
     skill_name = name or source_path.name
-    target = AGENT_PLUGINS_HOME / "skills" / skill_name
+    target = SKILLS_DIR / skill_name
     
     if target.exists():
         console.print(f"[yellow]Skill '{skill_name}' already exists.[/yellow]")
         return
     
-    shutil.copytree(source_path, target)
+    # copy_file_range shares extents on CoW filesystems (reflink), unlike
+    # hard links the copy stays independent of the source
+    shutil.copytree(source_path, target, copy_function=copy_file_fast)
+    invalidate_component_index()
     console.print(f"[green]✓[/green] Added skill: {skill_name}")
 
 
@@ -3056,13 +3631,14 @@ def remove_skill(
     name: str = typer.Argument(..., help="Skill name to remove"),
 ):
     """Remove an installed skill."""
-    target = AGENT_PLUGINS_HOME / "skills" / name
+    target = SKILLS_DIR / name
     
     if not target.exists():
         console.print(f"[red]Skill '{name}' not found.[/red]")
         raise typer.Exit(1)
     
     shutil.rmtree(target)
+    invalidate_component_index()
     console.print(f"[green]✓[/green] Removed skill: {name}")
 
 
@@ -3083,43 +3659,22 @@ def sync(
         
         console.print(f"[cyan]Syncing to {agent_config['name']}...[/cyan]")
         
-        # Sync skills
-        if agent_config.get("supports_skills"):
-            source = AGENT_PLUGINS_HOME / "skills"
-            target = agent_config["home"] / agent_config["skills_dir"]
-            
-            if create_symlink(source, target, force=force):
-                console.print(f"  [green]✓[/green] Skills linked")
-            elif target.is_symlink():
-                console.print(f"  [dim]Skills already linked[/dim]")
-        
-        # Sync plugins (if supported)
-        if agent_config.get("supports_plugins") and agent_config.get("plugins_dir"):
-            source = AGENT_PLUGINS_HOME / "plugins" / "marketplaces"
-            target = agent_config["home"] / agent_config["plugins_dir"]
-            
-            if target.is_symlink() and target.resolve() == source.resolve():
-                console.print(f"  [dim]Marketplaces already linked[/dim]")
-            elif create_symlink(source, target, force=force):
-                console.print(f"  [green]✓[/green] Marketplaces linked")
-
-        # Sync commands (if supported)
-        if agent_config.get("supports_commands"):
-            source = AGENT_PLUGINS_HOME / "commands"
+        for label, source, supports_key, dir_key, alt_key in SYNC_LINK_SPECS:
+            if not agent_config.get(supports_key):
+                continue
             
             # Determine target - some agents use alt location (e.g., OpenCode)
-            if agent_config.get("commands_alt_dir"):
-                target = agent_config["commands_alt_dir"]
-            elif agent_config.get("commands_dir"):
-                target = agent_config["home"] / agent_config["commands_dir"]
+            if alt_key and agent_config.get(alt_key):
+                target = agent_config[alt_key]
+            elif agent_config.get(dir_key):
+                target = agent_config["home"] / agent_config[dir_key]
             else:
-                target = None
+                continue
             
-            if target:
-                if create_link(source, target, force=force):
-                    console.print(f"  [green]✓[/green] Commands linked")
-                elif target.is_symlink():
-                    console.print(f"  [dim]Commands already linked[/dim]")
+            if symlink_points_to(target, source):
+                console.print(f"  [dim]{label} already linked[/dim]")
+            elif create_link(source, target, force=force):
+                console.print(f"  [green]✓[/green] {label} linked")
 
     console.print("[green]Sync complete![/green]")
 
@@ -3153,55 +3708,152 @@ def check():
 __version__ = "0.1.0"
 
 
-def get_installed_version() -> str:
-    """Get the currently installed version."""
+@functools.lru_cache(maxsize=1)
+def get_distribution_version() -> Optional[str]:
+    """Get the version from installed package metadata (read once per process).
+    
+    Returns None when there is no metadata, e.g. when running from a source tree.
+    """
     try:
         import importlib.metadata
         return importlib.metadata.version("agent-plugins")
     except Exception:
-        return __version__
+        return None
 
 
-def get_latest_version() -> Optional[str]:
-    """Fetch the latest version from PyPI or GitHub."""
-    # Try PyPI first
+def get_installed_version() -> str:
+    """Get the currently installed version."""
+    return get_distribution_version() or __version__
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client():
+    """Return the process-wide httpx.Client, creating it on first use.
+    
+    Building a client loads the CA bundle into a fresh SSL context (~30 ms),
+    which one-shot httpx.get() calls paid on every request.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            import httpx  # Deferred: slowest import, only needed here
+            import atexit
+            
+            _http_client = httpx.Client(
+                timeout=5,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=4)
+            )
+            atexit.register(_http_client.close)
+        return _http_client
+
+
+def fetch_pypi_version() -> Optional[str]:
+    """Fetch the latest released version from PyPI (None on any failure)."""
     try:
-        response = httpx.get(
-            "https://pypi.org/pypi/agent-plugins/json",
-            timeout=5,
-            follow_redirects=True
-        )
+        response = get_http_client().get("https://pypi.org/pypi/agent-plugins/json")
         if response.status_code == 200:
             data = response.json()
             return data.get("info", {}).get("version")
     except Exception:
         pass
-    
-    # Fallback: Try GitHub releases API
+    return None
+
+
+def fetch_github_version() -> Optional[str]:
+    """Fetch the latest release tag from GitHub (None on any failure)."""
     try:
-        response = httpx.get(
+        response = get_http_client().get(
             "https://api.github.com/repos/jms830/agent-plugins/releases/latest",
-            timeout=5,
-            follow_redirects=True,
             headers=get_github_auth_headers()
         )
         if response.status_code == 200:
             data = response.json()
             tag = data.get("tag_name", "")
-            # Remove 'v' prefix if present
-            return tag.lstrip("v") if tag else None
+            # Remove a single 'v' prefix if present
+            return tag.removeprefix("v") or None
     except Exception:
         pass
-    
     return None
 
 
+def run_in_daemon_thread(fn) -> Future:
+    """Start fn() in a daemon thread and return a Future for its result.
+    
+    Unlike a ThreadPoolExecutor worker, an abandoned daemon thread doesn't
+    hold up interpreter exit.
+    """
+    future = Future()
+    
+    def run():
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def ttl_file_cache(path: Path, ttl_seconds: int = 3600):
+    """Cache a no-argument function's result on disk for ttl_seconds.
+    
+    The wrapped function takes refresh=True to skip the cached value (the
+    fresh result is still written back). None results are not cached.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(refresh: bool = False):
+            if not refresh:
+                try:
+                    with open(path, "r") as f:
+                        entry = json.load(f)
+                    if time.time() - entry["ts"] < ttl_seconds:
+                        return entry["value"]
+                except (OSError, ValueError, KeyError, TypeError):
+                    pass
+            
+            result = fn()
+            if result is not None:
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                    with open(tmp_path, "w") as f:
+                        json.dump({"ts": time.time(), "value": result}, f)
+                    os.replace(tmp_path, path)
+                except OSError:
+                    pass
+            return result
+        return wrapper
+    return decorator
+
+
+@ttl_file_cache(AGENT_PLUGINS_HOME / ".cache" / "latest_version.json")
+def get_latest_version() -> Optional[str]:
+    """Fetch the latest version from PyPI or GitHub.
+    
+    Both lookups start at once, so a slow or unreachable PyPI no longer
+    delays the GitHub fallback. PyPI's answer still wins when it has one;
+    the GitHub request is then simply abandoned.
+    """
+    pypi = run_in_daemon_thread(fetch_pypi_version)
+    github = run_in_daemon_thread(fetch_github_version)
+    return pypi.result() or github.result()
+
+
 @app.command()
 def version(
     check_update: bool = typer.Option(
         False, "--check", "-c",
         help="Check for available updates"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache",
+        help="Ignore the cached latest version (refreshed hourly)"
+    ),
 ):
     """Display version and check for updates."""
     import platform
@@ -3221,7 +3873,7 @@ def version(
     
     if check_update:
         console.print("[dim]Checking for updates...[/dim]")
-        latest = get_latest_version()
+        latest = get_latest_version(refresh=no_cache)
         if latest:
             table.add_row("Latest", latest)
             if latest != installed:
@@ -3238,10 +3890,7 @@ def version(
     console.print(panel)
     
     if check_update:
-        console.print("\n[dim]To update, run:[/dim]")
-        console.print("  [cyan]uv tool upgrade agent-plugins[/cyan]")
-        console.print("  [dim]or[/dim]")
-        console.print("  [cyan]pip install --upgrade agent-plugins[/cyan]")
+        console.print("\n[dim]To update, run:[/dim]\n" + UPGRADE_COMMANDS_HINT)
 
 
 @app.command()
@@ -3261,18 +3910,26 @@ def upgrade(
     console.print("[cyan]Checking for updates...[/cyan]\n")
     
     installed = get_installed_version()
-    latest = get_latest_version()
+    # Without package metadata we're running from a source tree: there's
+    # nothing for uv/pip to upgrade, so don't spend the network round trips
+    source_install = get_distribution_version() is None and not force
+    latest = None if source_install else get_latest_version()
     
-    console.print(f"Installed: [cyan]{installed}[/cyan]")
-    if latest:
-        console.print(f"Latest:    [cyan]{latest}[/cyan]")
+    if source_install:
+        latest_text = "[dim]Not checked[/dim]"
     else:
-        console.print("Latest:    [dim]Unable to determine[/dim]")
+        latest_text = f"[cyan]{latest}[/cyan]" if latest else "[dim]Unable to determine[/dim]"
+    console.print(f"Installed: [cyan]{installed}[/cyan]\nLatest:    {latest_text}")
     
     # Check if update is needed
     needs_update = force or (latest and latest != installed) or (latest is None)
     
-    if not needs_update:
+    if source_install:
+        console.print(
+            "\n[yellow]No installed package metadata (running from source); "
+            "skipping CLI upgrade. Use --force to upgrade anyway.[/yellow]"
+        )
+    elif not needs_update:
         console.print("\n[green]✓ Already on the latest version![/green]")
     else:
         if latest is None:
@@ -3298,36 +3955,41 @@ def upgrade(
         
         if upgrade_cmd:
             try:
-                result = subprocess.run(
+                # Stream the installer's output so long reinstalls show progress;
+                # only the tail is kept for the failure message
+                tail = deque(maxlen=20)
+                proc = subprocess.Popen(
                     upgrade_cmd,
-                    capture_output=True,
-                    text=True
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1
                 )
-                if result.returncode == 0:
+                with console.status("[cyan]Upgrading...[/cyan]") as status:
+                    for line in proc.stdout:
+                        line = line.strip()
+                        if line:
+                            tail.append(line)
+                            status.update(f"[cyan]Upgrading...[/cyan] [dim]{escape(line[:80])}[/dim]")
+                returncode = proc.wait()
+                if returncode == 0:
                     console.print("[green]✓ CLI upgraded successfully![/green]")
                 else:
                     console.print(f"[yellow]Warning: Upgrade may have failed[/yellow]")
-                    if result.stderr:
-                        console.print(f"[dim]{result.stderr[:200]}[/dim]")
+                    if tail:
+                        output = "\n".join(tail)[-200:]
+                        console.print(f"[dim]{escape(output)}[/dim]")
             except Exception as e:
                 console.print(f"[red]Error upgrading:[/red] {e}")
         else:
-            console.print("[yellow]No package manager found (uv or pip)[/yellow]")
-            console.print("Please run manually:")
-            if use_git_reinstall:
-                console.print("  [cyan]uv tool install agent-plugins --force --from git+https://github.com/jms830/agent-plugins.git[/cyan]")
-                console.print("  [dim]or[/dim]")
-                console.print("  [cyan]pip install --force-reinstall git+https://github.com/jms830/agent-plugins.git[/cyan]")
-            else:
-                console.print("  [cyan]uv tool upgrade agent-plugins[/cyan]")
-                console.print("  [dim]or[/dim]")
-                console.print("  [cyan]pip install --upgrade agent-plugins[/cyan]")
+            hint = GIT_REINSTALL_COMMANDS_HINT if use_git_reinstall else UPGRADE_COMMANDS_HINT
+            console.print("[yellow]No package manager found (uv or pip)[/yellow]\nPlease run manually:\n" + hint)
         
         if latest is None:
-            console.print("\n[dim]Tip: If you installed from git, you can force reinstall with[/dim]")
-            console.print("  [cyan]uv tool install agent-plugins --force --from git+https://github.com/jms830/agent-plugins.git[/cyan]")
-            console.print("  [dim]or[/dim]")
-            console.print("  [cyan]pip install --force-reinstall git+https://github.com/jms830/agent-plugins.git[/cyan]")
+            console.print(
+                "\n[dim]Tip: If you installed from git, you can force reinstall with[/dim]\n"
+                + GIT_REINSTALL_COMMANDS_HINT
+            )
     
     # Also update marketplaces
     console.print("\n[cyan]Updating marketplaces...[/cyan]")
@@ -3336,15 +3998,19 @@ def upgrade(
     # Extract hooks and rebuild OpenCode structure
     console.print("\n[cyan]Extracting hooks and rebuilding structure...[/cyan]")
     
-    hooks_count = extract_hooks_from_marketplaces()
-    console.print(f"[green]✓[/green] Extracted {hooks_count} hooks")
-    
-    # Rebuild OpenCode structure (commands, agents, skills via symlinks)
-    oc_results = build_opencode_structure()
-    total_mp = sum(r["marketplace"] for r in oc_results.values())
-    console.print(f"[green]✓[/green] Linked {total_mp} marketplace components via symlinks")
-    
-    console.print("\n[green]✓ Upgrade complete![/green]")
+    # Hooks land in ~/.agent/hooks and the OpenCode links in ~/.agent/opencode,
+    # so the two rebuilds are independent and can overlap
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        hooks_future = executor.submit(extract_hooks_from_marketplaces)
+        oc_future = executor.submit(build_opencode_structure)
+        hooks_count = hooks_future.result()
+        oc_results = oc_future.result()
+    total_mp = sum(oc_results[comp]["marketplace"] for comp in ["commands", "agents", "skills"])
+    console.print(
+        f"[green]✓[/green] Extracted {hooks_count} hooks\n"
+        f"[green]✓[/green] Linked {total_mp} marketplace components via symlinks\n"
+        "\n[green]✓ Upgrade complete![/green]"
+    )
 
 
 def main():